@@ -1,8 +1,19 @@
 """Math Problems Generator for Elementary School Kids."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from math_generator.math_concepts import GradeLevel, MathConcept, MathTopic
-from math_generator.math_crew import MathProblemsCrew
-from math_generator.pdf_generator import MathPDFGenerator
+
+if TYPE_CHECKING:
+    from math_generator.math_crew import MathProblemsCrew
+    from math_generator.pdf_generator import MathPDFGenerator
+
+# Attributes backed by heavy dependencies (CrewAI, reportlab), imported on first access
+_LAZY_ATTRS = {
+    "MathProblemsCrew": "math_generator.math_crew",
+    "MathPDFGenerator": "math_generator.pdf_generator",
+}
 
 __all__ = [
     "MathProblemsCrew",
@@ -11,3 +22,14 @@ __all__ = [
     "GradeLevel",
     "MathPDFGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import heavy package attributes (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,77 @@
 """AWS Lambda handler for math problems generation."""
 
+import base64
+import io
 import json
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
 
 from math_generator.math_concepts import GradeLevel, MathTopic
 from math_generator.math_crew import MathProblemsCrew
 
+# Response headers shared by every API Gateway response. Treated as read-only.
+_CORS_HEADERS: dict[str, str] = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+
+# Accepted parameter values, listed in validation error messages
+_VALID_GRADES = [g.value for g in GradeLevel]
+_VALID_TOPICS = [t.value for t in MathTopic]
+
+T = TypeVar("T")
+
+
+def _param(
+    body: dict[str, Any],
+    query_params: dict[str, Any],
+    key: str,
+    default: Any,
+    cast: Callable[[Any], T],
+) -> T:
+    """Read a request parameter from the body, falling back to the query string.
+
+    Only a missing (``None``) body value falls back, so falsy values such as
+    ``0`` are passed through to validation instead of being replaced.
+
+    Args:
+        body: Parsed request body.
+        query_params: Query string parameters.
+        key: Parameter name.
+        default: Value used when the parameter is in neither place.
+        cast: Conversion applied to the selected value.
+
+    Returns:
+        The converted parameter value.
+    """
+    value = body.get(key)
+    if value is None:
+        value = query_params.get(key, default)
+    return cast(value)
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when available."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """AWS Lambda handler for generating math problems.
@@ -24,30 +90,32 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         # Parse request body
         body = event.get("body", "{}")
         if isinstance(body, str):
-            body = json.loads(body) if body else {}
+            body = _json_loads(body) if body else {}
 
         # Get parameters from query string or body
         query_params = event.get("queryStringParameters", {}) or {}
 
-        grade_str = body.get("grade") or query_params.get("grade", "grade_1")
-        topic_str = body.get("topic") or query_params.get("topic", "addition")
-        num_problems = int(body.get("num_problems") or query_params.get("num_problems", 5))
-        difficulty = int(body.get("difficulty") or query_params.get("difficulty", 1))
-        action = body.get("action") or query_params.get("action", "generate")
+        grade_str = _param(body, query_params, "grade", "grade_1", str)
+        topic_str = _param(body, query_params, "topic", "addition", str)
+        num_problems = _param(body, query_params, "num_problems", 5, int)
+        difficulty = _param(body, query_params, "difficulty", 1, int)
+        action = _param(body, query_params, "action", "generate", str)
 
         # Validate and convert grade level
         try:
             grade = GradeLevel(grade_str)
         except ValueError:
-            valid_grades = [g.value for g in GradeLevel]
-            return _error_response(400, f"Invalid grade: {grade_str}. Valid grades: {valid_grades}")
+            return _error_response(
+                400, f"Invalid grade: {grade_str}. Valid grades: {_VALID_GRADES}"
+            )
 
         # Validate and convert topic
         try:
             topic = MathTopic(topic_str)
         except ValueError:
-            valid_topics = [t.value for t in MathTopic]
-            return _error_response(400, f"Invalid topic: {topic_str}. Valid topics: {valid_topics}")
+            return _error_response(
+                400, f"Invalid topic: {topic_str}. Valid topics: {_VALID_TOPICS}"
+            )
 
         # Validate difficulty
         if not 1 <= difficulty <= 5:
@@ -60,25 +128,41 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         # Create the crew and execute the action
         crew = MathProblemsCrew(grade=grade, topic=topic, verbose=False)
 
+        # Imported here so health checks and rejected requests don't load reportlab
+        from math_generator.pdf_generator import MathPDFGenerator
+
+        # PDFs are rendered in memory and returned in the response, never written to disk
+        pdf_generator = MathPDFGenerator(output_dir=None)
+
+        render_pdf: Callable[..., str]
         if action == "generate":
             result = crew.generate_problems(
                 num_problems=num_problems,
                 difficulty=difficulty,
                 include_hints=True,
                 include_review=True,
+                generate_pdf=False,
             )
+            render_pdf = pdf_generator.generate_problems_pdf
         elif action == "explain":
-            result = crew.explain_concept()
+            result = crew.explain_concept(generate_pdf=False)
+            render_pdf = pdf_generator.generate_concept_pdf
         elif action == "worksheet":
             result = crew.generate_worksheet(
                 num_problems=num_problems,
                 difficulty=difficulty,
+                generate_pdf=False,
             )
+            render_pdf = pdf_generator.generate_worksheet_pdf
         else:
             return _error_response(
                 400, f"Invalid action: {action}. Valid actions: generate, explain, worksheet"
             )
 
+        pdf_buffer = io.BytesIO()
+        result["pdf_filename"] = render_pdf(result, stream=pdf_buffer)
+        result["pdf_base64"] = base64.b64encode(pdf_buffer.getbuffer()).decode("ascii")
+
         return _success_response(result)
 
     except ValueError as e:
@@ -98,13 +182,8 @@ def _success_response(data: dict[str, Any]) -> dict[str, Any]:
     """
     return {
         "statusCode": 200,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        },
-        "body": json.dumps(data),
+        "headers": _CORS_HEADERS,
+        "body": _json_dumps(data),
     }
 
 
@@ -120,13 +199,8 @@ def _error_response(status_code: int, message: str) -> dict[str, Any]:
     """
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        },
-        "body": json.dumps({"error": message}),
+        "headers": _CORS_HEADERS,
+        "body": _json_dumps({"error": message}),
     }
 
 
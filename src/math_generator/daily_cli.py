@@ -1,11 +1,25 @@
 """CLI for daily curriculum generation."""
 
 import argparse
+import functools
 import sys
 from typing import Any
 
+from math_generator.daily_curriculum import (
+    DailyCurriculum,
+    flush_progress_saves,
+    generate_daily_for_all_grades,
+)
 from math_generator.math_concepts import GradeLevel
-from math_generator.daily_curriculum import DailyCurriculum, generate_daily_for_all_grades
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of lines to stdout in a single call.
+
+    Args:
+        lines: Lines to write, without trailing newlines.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_progress_summary(summary: dict[str, Any]) -> None:
@@ -14,25 +28,29 @@ def print_progress_summary(summary: dict[str, Any]) -> None:
     Args:
         summary: Progress summary dictionary.
     """
-    print("\n" + "=" * 60)
-    print(f"CURRICULUM PROGRESS: {summary['grade'].upper()}")
-    print("=" * 60)
-    print(f"Current Topic: {summary['current_topic']}")
-    print(f"Topic {summary['current_topic_index'] + 1} of {summary['total_topics']}")
-    print(f"Days Completed: {summary['days_completed']}")
-    print(f"Progress: {summary['progress_percentage']:.1f}%")
-    print(f"Topics Remaining: {summary['topics_remaining']}")
+    lines = [
+        "",
+        "=" * 60,
+        f"CURRICULUM PROGRESS: {summary['grade'].upper()}",
+        "=" * 60,
+        f"Current Topic: {summary['current_topic']}",
+        f"Topic {summary['current_topic_index'] + 1} of {summary['total_topics']}",
+        f"Days Completed: {summary['days_completed']}",
+        f"Progress: {summary['progress_percentage']:.1f}%",
+        f"Topics Remaining: {summary['topics_remaining']}",
+    ]
 
     if summary['recent_history']:
-        print("\nRecent History:")
-        print("-" * 60)
+        lines.append("\nRecent History:")
+        lines.append("-" * 60)
         for entry in summary['recent_history']:
-            print(f"  Day {entry['day']} ({entry['date']}): {entry['topic']}")
+            lines.append(f"  Day {entry['day']} ({entry['date']}): {entry['topic']}")
             if entry.get('concept_guide_path'):
-                print(f"    ✓ Concept Guide: {entry['concept_guide_path']}")
+                lines.append(f"    ✓ Concept Guide: {entry['concept_guide_path']}")
             if entry.get('worksheet_path'):
-                print(f"    ✓ Worksheet: {entry['worksheet_path']}")
-    print("=" * 60 + "\n")
+                lines.append(f"    ✓ Worksheet: {entry['worksheet_path']}")
+    lines.append("=" * 60 + "\n")
+    _write_lines(lines)
 
 
 def print_week_plan(plan: list[dict[str, Any]]) -> None:
@@ -41,15 +59,14 @@ def print_week_plan(plan: list[dict[str, Any]]) -> None:
     Args:
         plan: List of daily plans.
     """
-    print("\n" + "=" * 60)
-    print("WEEKLY PLAN")
-    print("=" * 60)
+    lines = ["", "=" * 60, "WEEKLY PLAN", "=" * 60]
     for day_plan in plan:
-        print(f"\nDay {day_plan['day']}: {day_plan['topic'].replace('_', ' ').title()}")
-        print(f"  Topic {day_plan['topic_index']} of sequence")
-        print(f"  Day {day_plan['day_in_topic']} of {day_plan['total_days_for_topic']}")
-        print(f"  Focus: {day_plan['focus']}")
-    print("=" * 60 + "\n")
+        lines.append(f"\nDay {day_plan['day']}: {day_plan['topic'].replace('_', ' ').title()}")
+        lines.append(f"  Topic {day_plan['topic_index']} of sequence")
+        lines.append(f"  Day {day_plan['day_in_topic']} of {day_plan['total_days_for_topic']}")
+        lines.append(f"  Focus: {day_plan['focus']}")
+    lines.append("=" * 60 + "\n")
+    _write_lines(lines)
 
 
 def print_generation_result(result: dict[str, Any]) -> None:
@@ -59,38 +76,46 @@ def print_generation_result(result: dict[str, Any]) -> None:
         result: Generation result dictionary.
     """
     if result.get("status") == "completed":
-        print("\n" + "=" * 60)
-        print(f"🎉 {result['message']}")
-        print(f"Total Days Completed: {result['total_days']}")
-        print("=" * 60 + "\n")
+        _write_lines([
+            "",
+            "=" * 60,
+            f"🎉 {result['message']}",
+            f"Total Days Completed: {result['total_days']}",
+            "=" * 60 + "\n",
+        ])
         return
 
-    print("\n" + "=" * 60)
-    print(f"DAILY CONTENT GENERATED: {result['grade'].upper()}")
-    print("=" * 60)
-    print(f"Date: {result['date']}")
-    print(f"Day: {result['day']}")
-    print(f"Topic: {result['topic'].replace('_', ' ').title()}")
-    print(f"Topic Progress: {result['topic_sequence']} of {result['total_topics']}")
+    lines = [
+        "",
+        "=" * 60,
+        f"DAILY CONTENT GENERATED: {result['grade'].upper()}",
+        "=" * 60,
+        f"Date: {result['date']}",
+        f"Day: {result['day']}",
+        f"Topic: {result['topic'].replace('_', ' ').title()}",
+        f"Topic Progress: {result['topic_sequence']} of {result['total_topics']}",
+    ]
 
     if "concept_guide" in result:
-        print("\n📚 Concept Guide:")
-        print(f"  Description: {result['concept_guide'].get('description', 'N/A')}")
-        print(f"  PDF: {result['concept_guide'].get('pdf_path', 'Not generated')}")
+        lines.append("\n📚 Concept Guide:")
+        lines.append(f"  Description: {result['concept_guide'].get('description', 'N/A')}")
+        lines.append(f"  PDF: {result['concept_guide'].get('pdf_path', 'Not generated')}")
 
     if "worksheet" in result:
-        print("\n📝 Practice Worksheet:")
-        print(f"  Problems: {result['worksheet'].get('num_problems', 'N/A')}")
-        print(f"  PDF: {result['worksheet'].get('pdf_path', 'Not generated')}")
+        lines.append("\n📝 Practice Worksheet:")
+        lines.append(f"  Problems: {result['worksheet'].get('num_problems', 'N/A')}")
+        lines.append(f"  PDF: {result['worksheet'].get('pdf_path', 'Not generated')}")
 
-    print("=" * 60 + "\n")
+    lines.append("=" * 60 + "\n")
+    _write_lines(lines)
 
 
-def main() -> int:
-    """Main entry point for the daily curriculum CLI.
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the daily curriculum CLI.
 
     Returns:
-        Exit code (0 for success, non-zero for error).
+        Configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Generate daily math curriculum with sequential concept building",
@@ -186,6 +211,16 @@ Examples:
         help="Show verbose output",
     )
 
+    return parser
+
+
+def main() -> int:
+    """Main entry point for the daily curriculum CLI.
+
+    Returns:
+        Exit code (0 for success, non-zero for error).
+    """
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Validate arguments
@@ -203,18 +238,18 @@ Examples:
                 output_dir=args.output_dir,
                 verbose=args.verbose,
             )
+            flush_progress_saves()
 
-            print("\n" + "=" * 60)
-            print("DAILY CONTENT GENERATED FOR ALL GRADES")
-            print("=" * 60)
+            lines = ["", "=" * 60, "DAILY CONTENT GENERATED FOR ALL GRADES", "=" * 60]
             for grade_value, result in results.items():
-                print(f"\n{grade_value.upper()}:")
+                lines.append(f"\n{grade_value.upper()}:")
                 if result.get("status") == "success":
-                    print(f"  ✓ Topic: {result.get('topic')}")
-                    print(f"  ✓ Day: {result.get('day')}")
+                    lines.append(f"  ✓ Topic: {result.get('topic')}")
+                    lines.append(f"  ✓ Day: {result.get('day')}")
                 else:
-                    print(f"  ℹ {result.get('message', 'No content generated')}")
-            print("=" * 60 + "\n")
+                    lines.append(f"  ℹ {result.get('message', 'No content generated')}")
+            lines.append("=" * 60 + "\n")
+            _write_lines(lines)
 
             return 0
 
@@ -241,6 +276,7 @@ Examples:
         # Handle reset
         if args.reset:
             curriculum.reset_progress()
+            flush_progress_saves()
             print(f"\n✓ Progress reset for {grade.value}\n")
             summary = curriculum.get_progress_summary()
             print_progress_summary(summary)
@@ -248,7 +284,9 @@ Examples:
 
         # Handle next topic advancement
         if args.next_topic:
-            if curriculum.advance_to_next_topic():
+            advanced = curriculum.advance_to_next_topic()
+            flush_progress_saves()
+            if advanced:
                 print(f"\n✓ Advanced to next topic for {grade.value}\n")
                 summary = curriculum.get_progress_summary()
                 print_progress_summary(summary)
@@ -262,6 +300,7 @@ Examples:
             generate_concept_guide=not args.no_concept_guide,
             generate_worksheet=not args.no_worksheet,
         )
+        flush_progress_saves()
 
         print_generation_result(result)
 
@@ -1,12 +1,129 @@
 """Daily curriculum generator for sequential concept building."""
 
+import atexit
+import copy
 import json
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from math_generator.math_concepts import GradeLevel, MathTopic, get_topics_for_grade
-from math_generator.math_crew import MathProblemsCrew
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+from math_generator.math_concepts import (
+    GRADE_DIFFICULTY,
+    GradeLevel,
+    MathTopic,
+    get_topics_for_grade,
+)
+
+if TYPE_CHECKING:
+    from math_generator.math_crew import MathProblemsCrew
+
+# Parsed progress files keyed by path, stored with the mtime they were read at
+_PROGRESS_CACHE: dict[Path, tuple[float, dict[str, Any]]] = {}
+
+# Topic value sequence per grade, as recorded in newly initialized progress files
+_TOPICS_ORDER: dict[GradeLevel, tuple[str, ...]] = {
+    grade: tuple(topic.value for topic in get_topics_for_grade(grade)) for grade in GradeLevel
+}
+
+# Number of history entries kept in the progress file; older ones live in the JSONL log
+DEFAULT_HISTORY_LIMIT = 30
+
+
+def _dump_progress(progress: dict[str, Any]) -> bytes:
+    """Serialize progress to indented JSON bytes, using orjson when available."""
+    if _HAS_ORJSON:
+        return orjson.dumps(progress, option=orjson.OPT_INDENT_2)
+    return json.dumps(progress, indent=2).encode("utf-8")
+
+
+def _dump_history_entry(entry: dict[str, Any]) -> bytes:
+    """Serialize a history entry as a single JSONL line."""
+    if _HAS_ORJSON:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry).encode("utf-8") + b"\n"
+
+
+def _load_progress_bytes(data: bytes) -> dict[str, Any]:
+    """Parse progress JSON bytes, using orjson when available."""
+    progress: dict[str, Any] = orjson.loads(data) if _HAS_ORJSON else json.loads(data)
+    return progress
+
+
+# Pending progress writes, drained by a single background writer thread
+_SAVE_QUEUE: "queue.Queue[tuple[Path, bytes, dict[str, Any]]]" = queue.Queue()
+_SAVE_ERRORS: list[BaseException] = []
+_writer_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+
+
+def _progress_writer() -> None:
+    """Write queued progress snapshots to disk atomically, one at a time."""
+    while True:
+        path, data, snapshot = _SAVE_QUEUE.get()
+        try:
+            tmp_file = path.with_suffix(".tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, path)
+            _PROGRESS_CACHE[path] = (path.stat().st_mtime, snapshot)
+        except Exception as e:
+            _SAVE_ERRORS.append(e)
+        finally:
+            _SAVE_QUEUE.task_done()
+
+
+def _queue_progress_save(path: Path, progress: dict[str, Any]) -> None:
+    """Queue a progress snapshot to be written by the background writer.
+
+    Args:
+        path: Destination progress file.
+        progress: Progress dictionary; it is serialized and copied immediately.
+    """
+    global _writer_thread
+
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_progress_writer, name="progress-writer", daemon=True
+            )
+            _writer_thread.start()
+
+    _SAVE_QUEUE.put((path, _dump_progress(progress), copy.deepcopy(progress)))
+
+
+def flush_progress_saves() -> None:
+    """Block until all queued progress writes have reached disk.
+
+    Raises:
+        OSError: If a queued write failed since the last flush.
+    """
+    _SAVE_QUEUE.join()
+    if _SAVE_ERRORS:
+        error = _SAVE_ERRORS[0]
+        _SAVE_ERRORS.clear()
+        raise OSError(f"Failed to save curriculum progress: {error}") from error
+
+
+def _flush_progress_saves_at_exit() -> None:
+    """Drain pending progress writes at interpreter exit, reporting any failure."""
+    try:
+        flush_progress_saves()
+    except OSError as e:
+        sys.stderr.write(f"Error: {e}\n")
+
+
+atexit.register(_flush_progress_saves_at_exit)
 
 
 class DailyCurriculum:
@@ -17,6 +134,7 @@ class DailyCurriculum:
         grade: GradeLevel,
         output_dir: str = "output",
         verbose: bool = False,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
     ):
         """Initialize the daily curriculum generator.
 
@@ -24,30 +142,49 @@ class DailyCurriculum:
             grade: The target grade level.
             output_dir: Directory to save generated content and progress.
             verbose: Whether to show verbose output.
+            history_limit: Maximum number of history entries kept in the progress
+                file. The full history is appended to a separate JSONL log.
         """
         self.grade = grade
         self.output_dir = Path(output_dir)
         self.verbose = verbose
+        self.history_limit = history_limit
         self.progress_file = self.output_dir / f"curriculum_progress_{grade.value}.json"
+        self.history_log_file = self.output_dir / f"history_{grade.value}.jsonl"
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Get ordered topics for the grade level
         self.topics = get_topics_for_grade(grade)
+        self._n_topics = len(self.topics)
         
         # Load or initialize progress
         self.progress = self._load_progress()
 
+        # Mirror of progress["current_topic_index"]; both are updated together
+        self._idx: int = self.progress["current_topic_index"]
+
+        # Crews are reused across days spent on the same topic
+        self._crew_cache: dict[MathTopic, MathProblemsCrew] = {}
+
     def _load_progress(self) -> dict[str, Any]:
         """Load curriculum progress from file.
 
         Returns:
             Progress dictionary with current topic index and completion history.
         """
+        flush_progress_saves()
+
         if self.progress_file.exists():
-            with open(self.progress_file, "r") as f:
-                return json.load(f)
+            mtime = self.progress_file.stat().st_mtime
+            cached = _PROGRESS_CACHE.get(self.progress_file)
+            if cached is not None and cached[0] == mtime:
+                return copy.deepcopy(cached[1])
+
+            progress = _load_progress_bytes(self.progress_file.read_bytes())
+            _PROGRESS_CACHE[self.progress_file] = (mtime, copy.deepcopy(progress))
+            return progress
         
         # Initialize new progress
         return {
@@ -55,13 +192,18 @@ class DailyCurriculum:
             "current_topic_index": 0,
             "days_completed": 0,
             "history": [],
-            "topics_order": [topic.value for topic in self.topics],
+            "topics_order": list(_TOPICS_ORDER[self.grade]),
         }
 
     def _save_progress(self) -> None:
-        """Save current progress to file."""
-        with open(self.progress_file, "w") as f:
-            json.dump(self.progress, f, indent=2)
+        """Save current progress to file.
+
+        The write happens on a background thread so callers don't block on disk
+        I/O. The file is written to a temporary path first and then moved into
+        place, so a crash mid-write never leaves a truncated progress file behind.
+        Pending writes are flushed before any progress file is loaded and at exit.
+        """
+        _queue_progress_save(self.progress_file, self.progress)
 
     def get_current_topic(self) -> MathTopic | None:
         """Get the current topic to work on.
@@ -69,10 +211,7 @@ class DailyCurriculum:
         Returns:
             Current MathTopic or None if all topics completed.
         """
-        index = self.progress["current_topic_index"]
-        if index >= len(self.topics):
-            return None
-        return self.topics[index]
+        return self.topics[self._idx] if self._idx < self._n_topics else None
 
     def advance_to_next_topic(self) -> bool:
         """Move to the next topic in the sequence.
@@ -80,14 +219,30 @@ class DailyCurriculum:
         Returns:
             True if advanced, False if already at the end.
         """
-        if self.progress["current_topic_index"] < len(self.topics) - 1:
-            self.progress["current_topic_index"] += 1
+        if self._idx < self._n_topics - 1:
+            self._idx += 1
+            self.progress["current_topic_index"] = self._idx
             self._save_progress()
             return True
         return False
 
+    def _append_history(self, entry: dict[str, Any]) -> None:
+        """Record a history entry, keeping only the most recent ones in memory.
+
+        Args:
+            entry: History entry for a completed day.
+        """
+        with open(self.history_log_file, "ab") as f:
+            f.write(_dump_history_entry(entry))
+
+        history = self.progress["history"]
+        history.append(entry)
+        if len(history) > self.history_limit:
+            del history[: len(history) - self.history_limit]
+
     def reset_progress(self) -> None:
         """Reset curriculum progress to the beginning."""
+        self._idx = 0
         self.progress["current_topic_index"] = 0
         self.progress["days_completed"] = 0
         self.progress["history"] = []
@@ -118,22 +273,16 @@ class DailyCurriculum:
                 "total_days": self.progress["days_completed"],
             }
 
-        # Initialize crew for current topic
-        crew = MathProblemsCrew(
-            grade=self.grade,
-            topic=current_topic,
-            verbose=self.verbose,
-            output_dir=str(self.output_dir),
-        )
+        crew = self._get_crew(current_topic)
 
         results = {
             "status": "success",
             "grade": self.grade.value,
             "topic": current_topic.value,
             "day": self.progress["days_completed"] + 1,
-            "topic_sequence": self.progress["current_topic_index"] + 1,
-            "total_topics": len(self.topics),
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "topic_sequence": self._idx + 1,
+            "total_topics": self._n_topics,
+            "date": datetime.now().date().isoformat(),
         }
 
         # Generate concept guide (foundational learning)
@@ -168,33 +317,51 @@ class DailyCurriculum:
 
         # Update progress
         self.progress["days_completed"] += 1
-        self.progress["history"].append({
+        history_entry = {
             "day": self.progress["days_completed"],
             "date": results["date"],
             "topic": current_topic.value,
-            "topic_index": self.progress["current_topic_index"],
+            "topic_index": self._idx,
             "concept_guide_path": results.get("concept_guide", {}).get("pdf_path"),
             "worksheet_path": results.get("worksheet", {}).get("pdf_path"),
-        })
+        }
+        self._append_history(history_entry)
         self._save_progress()
 
         return results
 
+    def _get_crew(self, topic: MathTopic) -> "MathProblemsCrew":
+        """Get the crew for a topic, creating it on first use.
+
+        CrewAI is imported here rather than at module level so that progress-only
+        operations (status, week plan, reset) never pay for loading it.
+
+        Args:
+            topic: The math topic the crew should focus on.
+
+        Returns:
+            A MathProblemsCrew for this grade and topic.
+        """
+        crew = self._crew_cache.get(topic)
+        if crew is None:
+            from math_generator.math_crew import MathProblemsCrew
+
+            crew = MathProblemsCrew(
+                grade=self.grade,
+                topic=topic,
+                verbose=self.verbose,
+                output_dir=str(self.output_dir),
+            )
+            self._crew_cache[topic] = crew
+        return crew
+
     def _calculate_difficulty(self) -> int:
         """Calculate appropriate difficulty based on grade level.
 
         Returns:
             Difficulty level (1-5).
         """
-        difficulty_map = {
-            GradeLevel.KINDERGARTEN: 1,
-            GradeLevel.GRADE_1: 1,
-            GradeLevel.GRADE_2: 2,
-            GradeLevel.GRADE_3: 3,
-            GradeLevel.GRADE_4: 4,
-            GradeLevel.GRADE_5: 5,
-        }
-        return difficulty_map.get(self.grade, 1)
+        return GRADE_DIFFICULTY.get(self.grade, 1)
 
     def get_progress_summary(self) -> dict[str, Any]:
         """Get a summary of curriculum progress.
@@ -206,14 +373,14 @@ class DailyCurriculum:
         
         return {
             "grade": self.grade.value,
-            "total_topics": len(self.topics),
-            "current_topic_index": self.progress["current_topic_index"],
+            "total_topics": self._n_topics,
+            "current_topic_index": self._idx,
             "current_topic": current_topic.value if current_topic else "All completed",
             "days_completed": self.progress["days_completed"],
-            "topics_remaining": len(self.topics) - self.progress["current_topic_index"],
+            "topics_remaining": self._n_topics - self._idx,
             "progress_percentage": (
-                self.progress["current_topic_index"] / len(self.topics) * 100
-                if len(self.topics) > 0 else 100
+                self._idx / self._n_topics * 100
+                if self._n_topics > 0 else 100
             ),
             "recent_history": self.progress["history"][-5:] if self.progress["history"] else [],
         }
@@ -227,29 +394,27 @@ class DailyCurriculum:
         Returns:
             List of daily plans for the week.
         """
+        current_index = self._idx
+        topic_values = _TOPICS_ORDER[self.grade]
         week_plan = []
-        current_index = self.progress["current_topic_index"]
-        
+
         for day in range(1, 6):  # 5 school days
-            topic_index = current_index + (day - 1) // days_per_topic
-            
-            if topic_index >= len(self.topics):
+            topic_offset, day_offset = divmod(day - 1, days_per_topic)
+            topic_index = current_index + topic_offset
+
+            if topic_index >= self._n_topics:
                 break
-                
-            topic = self.topics[topic_index]
-            day_in_topic = ((day - 1) % days_per_topic) + 1
-            
+
             week_plan.append({
                 "day": day,
-                "topic": topic.value,
+                "topic": topic_values[topic_index],
                 "topic_index": topic_index + 1,
-                "day_in_topic": day_in_topic,
+                "day_in_topic": day_offset + 1,
                 "total_days_for_topic": days_per_topic,
-                "focus": "Concept Introduction" if day_in_topic == 1 else "Practice & Reinforcement",
+                "focus": "Concept Introduction" if day_offset == 0 else "Practice & Reinforcement",
             })
-        
-        return week_plan
 
+        return week_plan
 
 def generate_daily_for_all_grades(
     output_dir: str = "output",
@@ -258,37 +423,57 @@ def generate_daily_for_all_grades(
 ) -> dict[str, Any]:
     """Generate daily content for multiple grade levels.
 
+    Grades are independent of each other and each generation is dominated by
+    LLM network latency, so they are run concurrently on a thread pool.
+
     Args:
         output_dir: Directory to save generated content.
         grades: List of grade levels (if None, generates for all).
         verbose: Whether to show verbose output.
 
     Returns:
-        Dictionary with results for each grade.
+        Dictionary with results for each grade, in the order of ``grades``.
     """
     if grades is None:
         grades = list(GradeLevel)
 
-    results = {}
-    
-    for grade in grades:
-        if verbose:
-            print(f"\n{'=' * 60}")
-            print(f"Generating daily content for {grade.value}")
-            print(f"{'=' * 60}")
-        
-        curriculum = DailyCurriculum(grade=grade, output_dir=output_dir, verbose=verbose)
-        grade_result = curriculum.generate_daily_content()
-        results[grade.value] = grade_result
-        
-        if verbose:
-            print(f"\n✓ Completed {grade.value}")
-            if grade_result.get("status") == "success":
-                print(f"  - Topic: {grade_result.get('topic')}")
-                print(f"  - Day: {grade_result.get('day')}")
-                if "concept_guide" in grade_result:
-                    print(f"  - Concept Guide: {grade_result['concept_guide'].get('pdf_path')}")
-                if "worksheet" in grade_result:
-                    print(f"  - Worksheet: {grade_result['worksheet'].get('pdf_path')}")
-    
-    return results
+    if not grades:
+        return {}
+
+    print_lock = threading.Lock()
+    curricula = [
+        (grade, DailyCurriculum(grade=grade, output_dir=output_dir, verbose=verbose))
+        for grade in grades
+    ]
+
+    grade_results: dict[GradeLevel, dict[str, Any]] = {}
+
+    with ThreadPoolExecutor(max_workers=len(curricula)) as executor:
+        futures = {}
+        for grade, curriculum in curricula:
+            if verbose:
+                with print_lock:
+                    print(f"\n{'=' * 60}")
+                    print(f"Generating daily content for {grade.value}")
+                    print(f"{'=' * 60}")
+            futures[executor.submit(curriculum.generate_daily_content)] = grade
+
+        for future in as_completed(futures):
+            grade = futures[future]
+            grade_result = future.result()
+            grade_results[grade] = grade_result
+
+            if verbose:
+                with print_lock:
+                    print(f"\n✓ Completed {grade.value}")
+                    if grade_result.get("status") == "success":
+                        print(f"  - Topic: {grade_result.get('topic')}")
+                        print(f"  - Day: {grade_result.get('day')}")
+                        if "concept_guide" in grade_result:
+                            print(
+                                f"  - Concept Guide: {grade_result['concept_guide'].get('pdf_path')}"
+                            )
+                        if "worksheet" in grade_result:
+                            print(f"  - Worksheet: {grade_result['worksheet'].get('pdf_path')}")
+
+    return {grade.value: grade_results[grade] for grade in grades}
@@ -2,28 +2,43 @@
 
 import argparse
 import json
+import os
 import sys
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - diskcache is an optional speedup
+    diskcache = None
+
 from math_generator.math_concepts import (
+    GRADE_TOPICS_SET,
     GradeLevel,
     MathTopic,
     create_math_concept,
     get_topics_for_grade,
 )
-from math_generator.math_crew import MathProblemsCrew
 
+# Enum members by command line value; argparse has already validated the value
+_GRADE_BY_VALUE: dict[str, GradeLevel] = {g.value: g for g in GradeLevel}
+_TOPIC_BY_VALUE: dict[str, MathTopic] = {t.value: t for t in MathTopic}
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments.
+# Enum values accepted on the command line, computed once at import
+_GRADE_CHOICES = tuple(_GRADE_BY_VALUE)
+_TOPIC_CHOICES = tuple(_TOPIC_BY_VALUE)
 
-    Returns:
-        Parsed arguments namespace.
-    """
-    parser = argparse.ArgumentParser(
-        description="Generate math problems for elementary school kids",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Usage examples shown at the end of --help
+_EPILOG = """
 Examples:
   # Generate 5 addition problems for Grade 1
   math-generator --grade grade_1 --topic addition --num-problems 5
@@ -36,13 +51,49 @@ Examples:
 
   # List available topics for a grade
   math-generator --grade grade_4 --list-topics
-        """,
+        """
+
+# Outputs larger than this are written to stdout's binary buffer directly
+_LARGE_OUTPUT_BYTES = 4096
+
+# Results are cached under <output-dir>/.cache for this many seconds
+_CACHE_SUBDIR = ".cache"
+_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
+# Pre-rendered output of --list-grades
+_GRADE_LIST_LINES = (
+    "Available grade levels:",
+    "-" * 30,
+    *(f"  {grade}" for grade in _GRADE_CHOICES),
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    return _build_parser().parse_args()
+
+
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI.
+
+    Returns:
+        Configured argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate math problems for elementary school kids",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
         "--grade",
         type=str,
-        choices=[g.value for g in GradeLevel],
+        choices=_GRADE_CHOICES,
         default="grade_1",
         help="Target grade level (default: grade_1)",
     )
@@ -50,7 +101,7 @@ Examples:
     parser.add_argument(
         "--topic",
         type=str,
-        choices=[t.value for t in MathTopic],
+        choices=_TOPIC_CHOICES,
         default="addition",
         help="Math topic (default: addition)",
     )
@@ -144,6 +195,18 @@ Examples:
         help="Output format (default: text)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk result cache",
+    )
+
+    parser.add_argument(
+        "--regenerate",
+        action="store_true",
+        help="Ignore any cached result and generate a fresh one",
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -156,15 +219,12 @@ Examples:
         help="Suppress all output except results",
     )
 
-    return parser.parse_args()
+    return parser
 
 
 def list_grades() -> None:
     """Print all available grade levels."""
-    print("Available grade levels:")
-    print("-" * 30)
-    for grade in GradeLevel:
-        print(f"  {grade.value}")
+    print("\n".join(_GRADE_LIST_LINES))
 
 
 def list_topics_for_grade(grade: GradeLevel) -> None:
@@ -181,54 +241,193 @@ def list_topics_for_grade(grade: GradeLevel) -> None:
         print(f"  {topic.value}: {concept.description}")
 
 
-def format_output(result: dict[str, Any], output_format: str) -> str:
-    """Format the result for output.
+def iter_format(result: dict[str, Any], output_format: str) -> Iterator[str]:
+    """Format the result for output, one section at a time.
+
+    Text output is yielded section by section so it can be written as it is
+    produced; JSON output is yielded as a single chunk.
 
     Args:
         result: The result dictionary.
         output_format: Either 'text' or 'json'.
 
-    Returns:
-        Formatted string output.
+    Yields:
+        Chunks of formatted output which concatenate to the full output.
     """
     if output_format == "json":
-        return json.dumps(result, indent=2)
+        if _HAS_ORJSON:
+            yield orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            yield json.dumps(result, indent=2, ensure_ascii=False)
+        return
 
     # Text format
-    lines = []
-    lines.append("=" * 60)
-    lines.append(f"Grade: {result.get('grade', 'N/A')}")
-    lines.append(f"Topic: {result.get('topic', 'N/A')}")
-    
+    separator = "=" * 60
+    section_rule = "-" * 40
+    header = (
+        f"{separator}\n"
+        f"Grade: {result.get('grade', 'N/A')}\n"
+        f"Topic: {result.get('topic', 'N/A')}\n"
+    )
     if "pdf_path" in result:
-        lines.append(f"PDF Generated: {result['pdf_path']}")
-    
-    lines.append("=" * 60)
+        header += f"PDF Generated: {result['pdf_path']}\n"
+    yield f"{header}{separator}\n"
 
     if "explanation" in result:
-        lines.append("\nConcept Explanation:")
-        lines.append("-" * 40)
-        lines.append(result["explanation"])
+        yield f"\nConcept Explanation:\n{section_rule}\n{result['explanation']}\n"
 
     if "result" in result:
-        lines.append("\nGenerated Content:")
-        lines.append("-" * 40)
-        lines.append(result["result"])
+        yield f"\nGenerated Content:\n{section_rule}\n{result['result']}\n"
 
     if "worksheet" in result:
-        lines.append("\nWorksheet:")
-        lines.append("-" * 40)
-        lines.append(result["worksheet"])
+        yield f"\nWorksheet:\n{section_rule}\n{result['worksheet']}\n"
 
     if "tasks_output" in result:
-        lines.append("\nDetailed Output:")
-        lines.append("-" * 40)
+        yield f"\nDetailed Output:\n{section_rule}\n"
         for i, output in enumerate(result["tasks_output"], 1):
-            lines.append(f"\nTask {i} Output:")
-            lines.append(output)
+            yield f"\nTask {i} Output:\n{output}\n"
+
+    yield f"\n{separator}"
+
+
+def format_output(result: dict[str, Any], output_format: str) -> str:
+    """Format the result for output.
+
+    Args:
+        result: The result dictionary.
+        output_format: Either 'text' or 'json'.
 
-    lines.append("\n" + "=" * 60)
-    return "\n".join(lines)
+    Returns:
+        Formatted string output.
+    """
+    return "".join(iter_format(result, output_format))
+
+
+def format_output_bytes(result: dict[str, Any], output_format: str) -> bytes:
+    """Format the result as UTF-8 encoded bytes for writing to a file.
+
+    Args:
+        result: The result dictionary.
+        output_format: Either 'text' or 'json'.
+
+    Returns:
+        Formatted output encoded as UTF-8.
+    """
+    if output_format == "json" and _HAS_ORJSON:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    return format_output(result, output_format).encode("utf-8")
+
+
+def _write_stdout(output: bytes) -> None:
+    """Write formatted output to stdout followed by a newline.
+
+    Large outputs bypass print() and go straight to the underlying binary
+    buffer; small ones keep using print() for normal TTY behavior.
+
+    Args:
+        output: UTF-8 encoded output.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or len(output) <= _LARGE_OUTPUT_BYTES:
+        print(output.decode("utf-8"))
+        return
+
+    sys.stdout.flush()
+    buffer.write(output + b"\n")
+    buffer.flush()
+
+
+def _open_result_cache(output_dir: str) -> Any:
+    """Open the on-disk result cache.
+
+    Args:
+        output_dir: The CLI output directory; the cache lives in a subdirectory.
+
+    Returns:
+        A diskcache Cache, or None if diskcache is not installed.
+    """
+    if diskcache is None:
+        return None
+    return diskcache.Cache(str(Path(output_dir) / _CACHE_SUBDIR))
+
+
+def _get_cached_result(cache: Any, key: tuple) -> dict[str, Any] | None:
+    """Look up a cached result, ignoring entries whose PDF has been removed.
+
+    Args:
+        cache: The result cache.
+        key: The normalized argument tuple.
+
+    Returns:
+        The cached result dictionary, or None on a miss.
+    """
+    result: dict[str, Any] | None = cache.get(key)
+    if result is None:
+        return None
+    if "pdf_path" in result and not os.path.exists(result["pdf_path"]):
+        return None
+    return result
+
+
+def _run_action(
+    args: argparse.Namespace,
+    grade: GradeLevel,
+    topic: MathTopic,
+    generate_pdf: bool,
+) -> dict[str, Any] | None:
+    """Run the requested action through the crew.
+
+    Args:
+        args: Parsed command line arguments.
+        grade: The target grade level.
+        topic: The math topic.
+        generate_pdf: Whether to generate a PDF file.
+
+    Returns:
+        The action result, or None if the action is unknown.
+    """
+    # Imported here so the listing options and cache hits don't pay for loading CrewAI
+    from math_generator.math_crew import MathProblemsCrew
+
+    if not args.quiet:
+        print(f"Initializing math problems generator for {grade.value} - {topic.value}...")
+
+    crew = MathProblemsCrew(
+        grade=grade,
+        topic=topic,
+        verbose=args.verbose,
+        output_dir=args.output_dir,
+    )
+
+    # Execute the requested action
+    if args.action == "generate":
+        if not args.quiet:
+            print(f"Generating {args.num_problems} problems...")
+        return crew.generate_problems(
+            num_problems=args.num_problems,
+            difficulty=args.difficulty,
+            include_hints=not args.no_hints,
+            include_review=not args.no_review,
+            generate_pdf=generate_pdf,
+            frequency=args.frequency,
+        )
+    if args.action == "explain":
+        if not args.quiet:
+            print("Generating concept explanation...")
+        return crew.explain_concept(
+            generate_pdf=generate_pdf,
+            frequency=args.frequency,
+        )
+    if args.action == "worksheet":
+        if not args.quiet:
+            print(f"Generating worksheet with {args.num_problems} problems...")
+        return crew.generate_worksheet(
+            num_problems=args.num_problems,
+            difficulty=args.difficulty,
+            generate_pdf=generate_pdf,
+            frequency=args.frequency,
+        )
+    return None
 
 
 def main() -> int:
@@ -244,78 +443,68 @@ def main() -> int:
         list_grades()
         return 0
 
-    grade = GradeLevel(args.grade)
+    grade = _GRADE_BY_VALUE[args.grade]
 
     if args.list_topics:
         list_topics_for_grade(grade)
         return 0
 
     # Validate topic for grade
-    topic = MathTopic(args.topic)
-    valid_topics = get_topics_for_grade(grade)
+    topic = _TOPIC_BY_VALUE[args.topic]
 
-    if topic not in valid_topics:
+    if topic not in GRADE_TOPICS_SET.get(grade, frozenset()):
         print(f"Error: Topic '{topic.value}' is not available for {grade.value}")
         print("Available topics:")
         list_topics_for_grade(grade)
         return 1
 
-    # Create the crew
     try:
-        if not args.quiet:
-            print(f"Initializing math problems generator for {grade.value} - {topic.value}...")
-
         generate_pdf = args.pdf and not args.no_pdf
 
-        crew = MathProblemsCrew(
-            grade=grade,
-            topic=topic,
-            verbose=args.verbose,
-            output_dir=args.output_dir,
+        cache = None if args.no_cache else _open_result_cache(args.output_dir)
+        cache_key = (
+            grade.value,
+            topic.value,
+            args.action,
+            args.difficulty,
+            args.num_problems,
+            args.no_hints,
+            args.no_review,
+            generate_pdf,
+            args.frequency,
         )
 
-        # Execute the requested action
-        if args.action == "generate":
-            if not args.quiet:
-                print(f"Generating {args.num_problems} problems...")
-            result = crew.generate_problems(
-                num_problems=args.num_problems,
-                difficulty=args.difficulty,
-                include_hints=not args.no_hints,
-                include_review=not args.no_review,
-                generate_pdf=generate_pdf,
-                frequency=args.frequency,
-            )
-        elif args.action == "explain":
-            if not args.quiet:
-                print("Generating concept explanation...")
-            result = crew.explain_concept(
-                generate_pdf=generate_pdf,
-                frequency=args.frequency,
-            )
-        elif args.action == "worksheet":
-            if not args.quiet:
-                print(f"Generating worksheet with {args.num_problems} problems...")
-            result = crew.generate_worksheet(
-                num_problems=args.num_problems,
-                difficulty=args.difficulty,
-                generate_pdf=generate_pdf,
-                frequency=args.frequency,
-            )
-        else:
-            print(f"Error: Unknown action '{args.action}'")
-            return 1
-
-        # Format and output the result
-        output = format_output(result, args.format)
-
+        result = None
+        if cache is not None and not args.regenerate:
+            result = _get_cached_result(cache, cache_key)
+            if result is not None and not args.quiet:
+                print("Using cached result (pass --regenerate to refresh)...")
+
+        if result is None:
+            result = _run_action(args, grade, topic, generate_pdf)
+            if result is None:
+                print(f"Error: Unknown action '{args.action}'")
+                return 1
+            if cache is not None:
+                cache.set(cache_key, result, expire=_CACHE_EXPIRE_SECONDS)
+
+        # Format and output the result; JSON is written in one piece, text is
+        # streamed section by section
         if args.output:
-            with open(args.output, "w") as f:
-                f.write(output)
+            with open(args.output, "wb") as f:
+                if args.format == "json":
+                    f.write(format_output_bytes(result, args.format))
+                else:
+                    f.writelines(
+                        chunk.encode("utf-8") for chunk in iter_format(result, args.format)
+                    )
             if not args.quiet:
                 print(f"Output written to {args.output}")
+        elif args.format == "json":
+            _write_stdout(format_output_bytes(result, args.format))
         else:
-            print(output)
+            sys.stdout.writelines(iter_format(result, args.format))
+            sys.stdout.write("\n")
 
         return 0
 
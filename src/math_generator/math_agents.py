@@ -1,74 +1,230 @@
 """CrewAI agents for math problem generation."""
 
 import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import NamedTuple
+
 from crewai import LLM, Agent
+from dotenv import load_dotenv
 
 from math_generator.math_concepts import GradeLevel, MathTopic
 
 # Load environment variables from .env file
 load_dotenv()
 
+# LLM settings are read once at import; changing them requires a new process
+_DEFAULT_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
+_DEFAULT_MODEL = os.getenv("OPENAI_MODEL_NAME", "gpt-4")
+_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# Providers that only cache prompt prefixes marked with cache_control blocks;
+# OpenAI and Azure cache long prefixes automatically
+_CACHE_CONTROL_PROVIDERS = frozenset({"anthropic", "bedrock", "vertex_ai"})
 
-def get_llm(model_id: str | None = None) -> LLM:
+
+def get_llm(model_id: str | None = None, provider: str | None = None) -> LLM:
     """Get the LLM instance for agents.
 
+    Instances are cached per (provider, model ID), so all agents built for the
+    same model share a single LLM client. LLM_PROVIDER, OPENAI_MODEL_NAME and
+    OPENAI_API_KEY are read once when this module is imported.
+
     Args:
-        model_id: The OpenAI model ID to use. If not provided, uses the
+        model_id: The model ID to use. If not provided, uses the
                  OPENAI_MODEL_NAME environment variable or defaults to 'gpt-4'.
+        provider: The LiteLLM provider prefix (e.g. 'openai', 'bedrock'). If not
+                 provided, uses the LLM_PROVIDER environment variable or
+                 defaults to 'openai'.
 
     Returns:
-        An LLM instance configured for OpenAI.
+        An LLM instance configured for the provider.
     """
     if model_id is None:
-        model_id = os.getenv("OPENAI_MODEL_NAME", "gpt-4")
-    
+        model_id = _DEFAULT_MODEL
+    if provider is None:
+        provider = _DEFAULT_PROVIDER
+
+    return _build_llm(provider, model_id)
+
+
+@lru_cache(maxsize=8)
+def _build_llm(provider: str, model_id: str) -> LLM:
+    """Construct the LLM instance for a resolved provider and model ID.
+
+    Only the OpenAI provider is given OPENAI_API_KEY explicitly; other
+    providers pick up their own credentials from the environment. Providers
+    in ``_CACHE_CONTROL_PROVIDERS`` get a cache_control breakpoint on the
+    system message, so each agent's role/goal/backstory prefix is cached
+    across calls.
+
+    Args:
+        provider: The LiteLLM provider prefix.
+        model_id: The model ID to use.
+
+    Returns:
+        An LLM instance configured for the provider.
+    """
+    extra_params = {}
+    if provider in _CACHE_CONTROL_PROVIDERS:
+        extra_params["cache_control_injection_points"] = [
+            {"location": "message", "role": "system"}
+        ]
+
     return LLM(
-        model=f"openai/{model_id}",
+        model=f"{provider}/{model_id}",
         temperature=0.7,
-        api_key=os.getenv("OPENAI_API_KEY"),
+        api_key=_API_KEY if provider == "openai" else None,
+        **extra_params,
     )
 
 
-def create_math_concept_expert(
+class AgentSpec(NamedTuple):
+    """Static definition of an agent kind.
+
+    Templates are formatted with ``grade_name`` and, when ``uses_topic`` is
+    set, ``topic_name``. They become the agent's system prompt, which is the
+    prefix cached by the provider, so they must not depend on anything that
+    changes between calls for the same crew (difficulty, problem counts and
+    other per-request details belong in the task descriptions).
+    """
+
+    role: str
+    goal_template: str
+    backstory_template: str
+    uses_topic: bool
+
+
+# Agent definitions keyed by the names used throughout the crew
+_AGENT_SPECS: dict[str, AgentSpec] = {
+    "concept_expert": AgentSpec(
+        role="Mathematics Concept Expert",
+        goal_template=(
+            "Provide clear, age-appropriate explanations of {topic_name} "
+            "concepts for {grade_name} students."
+        ),
+        backstory_template=(
+            "You are an experienced elementary school mathematics teacher who specializes "
+            "in teaching {topic_name} to young students in Wake County of North Carolina, "
+            "USA. You have a gift for "
+            "making complex mathematical concepts simple and engaging. You understand the "
+            "developmental stages of children in {grade_name} and adapt "
+            "your explanations accordingly. You always use encouraging language and provide "
+            "relatable examples that children can understand."
+        ),
+        uses_topic=True,
+    ),
+    "problem_generator": AgentSpec(
+        role="Mathematics Problem Generator",
+        goal_template=(
+            "Generate engaging, educational math problems about "
+            "{topic_name} that are appropriate for {grade_name} students."
+        ),
+        backstory_template=(
+            "You are a curriculum designer who creates math worksheets and "
+            "practice problems for elementary school students. You specialize in creating "
+            "problems for {grade_name} students focusing on "
+            "{topic_name}. Your problems are creative, engaging, and "
+            "progressively challenging while remaining age-appropriate. You include "
+            "real-world scenarios that children can relate to, such as toys, animals, "
+            "food, and everyday activities."
+        ),
+        uses_topic=True,
+    ),
+    "problem_reviewer": AgentSpec(
+        role="Math Problem Reviewer",
+        goal_template=(
+            "Review and validate mathematics problems to ensure they are accurate, "
+            "age-appropriate for {grade_name}, and educationally sound."
+        ),
+        backstory_template=(
+            "You are a senior educational consultant who specializes in "
+            "elementary math education. You review math problems to ensure they meet "
+            "curriculum standards for {grade_name} students. You check "
+            "for mathematical accuracy, appropriate difficulty level, clear wording, "
+            "and educational value. You provide constructive feedback to improve "
+            "problems when necessary."
+        ),
+        uses_topic=False,
+    ),
+    "hint_provider": AgentSpec(
+        role="Mathematics Hint Provider",
+        goal_template=(
+            "Create helpful, scaffolded hints and step-by-step explanations "
+            "that guide {grade_name} students to solve math problems "
+            "without giving away the answer directly."
+        ),
+        backstory_template=(
+            "You are a patient math tutor who excels at helping struggling "
+            "students understand math concepts. You create hints that break down problems "
+            "into manageable steps for {grade_name} students. Your hints "
+            "encourage students to think critically while providing just enough guidance "
+            "to keep them from getting frustrated. You use visual descriptions and "
+            "relatable examples to help children understand."
+        ),
+        uses_topic=False,
+    ),
+}
+
+
+@cache
+def _agent_prompt(kind: str, grade: GradeLevel, topic: MathTopic | None) -> tuple[str, str]:
+    """Format the goal and backstory for an agent kind.
+
+    Args:
+        kind: Key into the agent specs.
+        grade: The target grade level.
+        topic: The math topic, or None for agents that don't use one.
+
+    Returns:
+        Tuple of (goal, backstory).
+
+    Raises:
+        ValueError: If the agent kind requires a topic and none is given.
+    """
+    spec = _AGENT_SPECS[kind]
+    names = {"grade_name": grade.display_name}
+    if spec.uses_topic:
+        if topic is None:
+            raise ValueError(f"Agent kind '{kind}' requires a topic")
+        names["topic_name"] = topic.display_name
+    return spec.goal_template.format(**names), spec.backstory_template.format(**names)
+
+
+def build_agent(
+    kind: str,
     grade: GradeLevel,
-    topic: MathTopic,
+    topic: MathTopic | None = None,
     llm: LLM | None = None,
 ) -> Agent:
-    """Create a mathematics concept expert agent.
-
-    This agent specializes in understanding and explaining math concepts
-    appropriate for elementary school students.
+    """Create an agent from its spec.
 
     Args:
+        kind: The agent kind: 'concept_expert', 'problem_generator',
+              'problem_reviewer' or 'hint_provider'.
         grade: The target grade level.
-        topic: The math topic to focus on.
+        topic: The math topic. Required for topic-specific agents.
         llm: Optional LLM instance. If not provided, uses default.
 
     Returns:
-        A CrewAI Agent configured as a math concept expert.
+        A CrewAI Agent configured according to the spec.
+
+    Raises:
+        ValueError: If the kind is unknown or a required topic is missing.
     """
+    spec = _AGENT_SPECS.get(kind)
+    if spec is None:
+        raise ValueError(f"Unknown agent kind: {kind}. Valid kinds: {list(_AGENT_SPECS)}")
+    if spec.uses_topic and topic is None:
+        raise ValueError(f"Agent kind '{kind}' requires a topic")
+
     if llm is None:
         llm = get_llm()
 
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
-
-    goal = (
-        f"Provide clear, age-appropriate explanations of {topic_name} "
-        f"concepts for {grade_name} students."
-    )
-    backstory = (
-        f"You are an experienced elementary school mathematics teacher who specializes "
-        f"in teaching {topic_name} to young students in Wake County of North Carolina, USA. You have a gift for "
-        "making complex mathematical concepts simple and engaging. You understand the "
-        f"developmental stages of children in {grade_name} and adapt "
-        "your explanations accordingly. You always use encouraging language and provide "
-        "relatable examples that children can understand."
-    )
+    goal, backstory = _agent_prompt(kind, grade, topic if spec.uses_topic else None)
 
     return Agent(
-        role="Mathematics Concept Expert",
+        role=spec.role,
         goal=goal,
         backstory=backstory,
         verbose=True,
@@ -77,6 +233,27 @@ def create_math_concept_expert(
     )
 
 
+def create_math_concept_expert(
+    grade: GradeLevel,
+    topic: MathTopic,
+    llm: LLM | None = None,
+) -> Agent:
+    """Create a mathematics concept expert agent.
+
+    This agent specializes in understanding and explaining math concepts
+    appropriate for elementary school students.
+
+    Args:
+        grade: The target grade level.
+        topic: The math topic to focus on.
+        llm: Optional LLM instance. If not provided, uses default.
+
+    Returns:
+        A CrewAI Agent configured as a math concept expert.
+    """
+    return build_agent("concept_expert", grade, topic, llm)
+
+
 def create_problem_generator(
     grade: GradeLevel,
     topic: MathTopic,
@@ -95,34 +272,7 @@ def create_problem_generator(
     Returns:
         A CrewAI Agent configured as a problem generator.
     """
-    if llm is None:
-        llm = get_llm()
-
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
-
-    goal = (
-        f"Generate engaging, educational math problems about "
-        f"{topic_name} that are appropriate for {grade_name} students."
-    )
-    backstory = (
-        "You are a curriculum designer who creates math worksheets and "
-        f"practice problems for elementary school students. You specialize in creating "
-        f"problems for {grade_name} students focusing on "
-        f"{topic_name}. Your problems are creative, engaging, and "
-        "progressively challenging while remaining age-appropriate. You include "
-        "real-world scenarios that children can relate to, such as toys, animals, "
-        "food, and everyday activities."
-    )
-
-    return Agent(
-        role="Mathematics Problem Generator",
-        goal=goal,
-        backstory=backstory,
-        verbose=True,
-        allow_delegation=False,
-        llm=llm,
-    )
+    return build_agent("problem_generator", grade, topic, llm)
 
 
 def create_problem_reviewer(
@@ -141,32 +291,7 @@ def create_problem_reviewer(
     Returns:
         A CrewAI Agent configured as a problem reviewer.
     """
-    if llm is None:
-        llm = get_llm()
-
-    grade_name = grade.value.replace("_", " ")
-
-    goal = (
-        "Review and validate mathematics problems to ensure they are accurate, "
-        f"age-appropriate for {grade_name}, and educationally sound."
-    )
-    backstory = (
-        "You are a senior educational consultant who specializes in "
-        "elementary math education. You review math problems to ensure they meet "
-        f"curriculum standards for {grade_name} students. You check "
-        "for mathematical accuracy, appropriate difficulty level, clear wording, "
-        "and educational value. You provide constructive feedback to improve "
-        "problems when necessary."
-    )
-
-    return Agent(
-        role="Math Problem Reviewer",
-        goal=goal,
-        backstory=backstory,
-        verbose=True,
-        allow_delegation=False,
-        llm=llm,
-    )
+    return build_agent("problem_reviewer", grade, llm=llm)
 
 
 def create_hint_provider(
@@ -185,29 +310,32 @@ def create_hint_provider(
     Returns:
         A CrewAI Agent configured as a hint provider.
     """
+    return build_agent("hint_provider", grade, llm=llm)
+
+
+def build_all_agents(
+    grade: GradeLevel,
+    topic: MathTopic,
+    llm: LLM | None = None,
+) -> dict[str, Agent]:
+    """Create the full set of agents used by a math problems crew.
+
+    The four agents are independent, so they are constructed concurrently.
+    All of them share the same LLM instance.
+
+    Args:
+        grade: The target grade level.
+        topic: The math topic to focus on.
+        llm: Optional LLM instance. If not provided, uses default.
+
+    Returns:
+        Dictionary of agent name to Agent instance.
+    """
     if llm is None:
         llm = get_llm()
 
-    grade_name = grade.value.replace("_", " ")
-    goal = (
-        "Create helpful, scaffolded hints and step-by-step explanations "
-        f"that guide {grade_name} students to solve math problems "
-        "without giving away the answer directly."
-    )
-    backstory = (
-        "You are a patient math tutor who excels at helping struggling "
-        "students understand math concepts. You create hints that break down problems "
-        f"into manageable steps for {grade_name} students. Your hints "
-        "encourage students to think critically while providing just enough guidance "
-        "to keep them from getting frustrated. You use visual descriptions and "
-        "relatable examples to help children understand."
-    )
-
-    return Agent(
-        role="Mathematics Hint Provider",
-        goal=goal,
-        backstory=backstory,
-        verbose=True,
-        allow_delegation=False,
-        llm=llm,
-    )
+    with ThreadPoolExecutor(max_workers=len(_AGENT_SPECS)) as executor:
+        futures = {
+            kind: executor.submit(build_agent, kind, grade, topic, llm) for kind in _AGENT_SPECS
+        }
+        return {kind: future.result() for kind, future in futures.items()}
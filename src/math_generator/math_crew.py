@@ -1,18 +1,14 @@
 """CrewAI crew orchestration for math problem generation."""
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from crewai import LLM, Crew, Process
+from crewai import LLM, Crew, Process, Task
 
-from math_generator.math_agents import (
-    create_hint_provider,
-    create_math_concept_expert,
-    create_problem_generator,
-    create_problem_reviewer,
-    get_llm,
-)
-from math_generator.pdf_generator import MathPDFGenerator
+from math_generator.math_agents import build_all_agents, get_llm
 from math_generator.math_concepts import (
+    GRADE_TOPICS_SET,
     GradeLevel,
     MathTopic,
     get_concept_description,
@@ -26,6 +22,25 @@ from math_generator.math_tasks import (
     create_worksheet_compilation_task,
 )
 
+if TYPE_CHECKING:
+    from math_generator.pdf_generator import MathPDFGenerator
+
+# Upper bound on topics generated concurrently by generate_problems_for_grade
+_MAX_TOPIC_WORKERS = 8
+
+
+def _task_output(task: Task) -> str | None:
+    """Get a finished task's output as text.
+
+    Args:
+        task: A task that has been run by a crew.
+
+    Returns:
+        The stringified output, or None if the task produced none.
+    """
+    output = task.output
+    return str(output) if output else None
+
 
 class MathProblemsCrew:
     """Orchestrates the math problems generation crew."""
@@ -51,29 +66,53 @@ class MathProblemsCrew:
         self.topic = topic
         self.llm = llm or get_llm()
         self.verbose = verbose
-        self.pdf_generator = MathPDFGenerator(output_dir=output_dir)
+        self._output_dir = output_dir
 
         # Validate that topic is appropriate for grade
-        valid_topics = get_topics_for_grade(grade)
-        if topic not in valid_topics:
-            valid_topic_names = [t.value for t in valid_topics]
+        if topic not in GRADE_TOPICS_SET.get(grade, frozenset()):
+            valid_topic_names = [t.value for t in get_topics_for_grade(grade)]
             raise ValueError(
                 f"Topic '{topic.value}' is not appropriate for {grade.value}. "
                 f"Valid topics: {valid_topic_names}"
             )
 
+    @cached_property
+    def pdf_generator(self) -> "MathPDFGenerator":
+        """PDF generator for this crew, created the first time a PDF is requested.
+
+        Returns:
+            A MathPDFGenerator writing to the crew's output directory.
+        """
+        # Imported here so callers that never generate PDFs don't load reportlab
+        from math_generator.pdf_generator import MathPDFGenerator
+
+        return MathPDFGenerator(output_dir=self._output_dir)
+
     def _create_agents(self) -> dict[str, Any]:
         """Create all agents for the crew.
 
         Returns:
             Dictionary of agent name to Agent instance.
         """
-        return {
-            "concept_expert": create_math_concept_expert(self.grade, self.topic, self.llm),
-            "problem_generator": create_problem_generator(self.grade, self.topic, self.llm),
-            "problem_reviewer": create_problem_reviewer(self.grade, self.llm),
-            "hint_provider": create_hint_provider(self.grade, self.llm),
-        }
+        return build_all_agents(self.grade, self.topic, self.llm)
+
+    @cached_property
+    def _agents(self) -> dict[str, Any]:
+        """Agents for this crew, built on first use and shared by every action.
+
+        Returns:
+            Dictionary of agent name to Agent instance.
+        """
+        return self._create_agents()
+
+    @cached_property
+    def _agents_list(self) -> list[Any]:
+        """All agents for this crew, in the order passed to Crew.
+
+        Returns:
+            List of Agent instances.
+        """
+        return list(self._agents.values())
 
     def generate_problems(
         self,
@@ -97,7 +136,7 @@ class MathProblemsCrew:
         Returns:
             Dictionary containing generated problems, metadata, and PDF path if generated.
         """
-        agents = self._create_agents()
+        agents = self._agents
         tasks = []
 
         # Create problem generation task
@@ -132,13 +171,14 @@ class MathProblemsCrew:
 
         # Create and run the crew
         crew = Crew(
-            agents=list(agents.values()),
+            agents=self._agents_list,
             tasks=tasks,
             process=Process.sequential,
             verbose=self.verbose,
         )
 
         result = crew.kickoff()
+        outputs = [_task_output(task) for task in tasks]
 
         result_data = {
             "grade": self.grade.value,
@@ -146,7 +186,7 @@ class MathProblemsCrew:
             "num_problems": num_problems,
             "difficulty": difficulty,
             "result": str(result),
-            "tasks_output": [str(task.output) for task in tasks if task.output],
+            "tasks_output": [output for output in outputs if output is not None],
         }
 
         # Generate PDF if requested
@@ -171,7 +211,7 @@ class MathProblemsCrew:
         Returns:
             Dictionary containing the concept explanation and PDF path if generated.
         """
-        agents = self._create_agents()
+        agents = self._agents
 
         concept_task = create_concept_explanation_task(
             agent=agents["concept_expert"],
@@ -222,7 +262,7 @@ class MathProblemsCrew:
         Returns:
             Dictionary containing the complete worksheet and PDF path if generated.
         """
-        agents = self._create_agents()
+        agents = self._agents
         tasks = []
 
         # Generate concept explanation
@@ -272,7 +312,7 @@ class MathProblemsCrew:
 
         # Create and run the crew
         crew = Crew(
-            agents=list(agents.values()),
+            agents=self._agents_list,
             tasks=tasks,
             process=Process.sequential,
             verbose=self.verbose,
@@ -298,6 +338,31 @@ class MathProblemsCrew:
         return result_data
 
 
+def _run_one(
+    grade: GradeLevel,
+    topic: MathTopic,
+    llm: LLM | None,
+    num_problems: int,
+) -> dict[str, Any]:
+    """Generate problems for a single topic of a grade.
+
+    Args:
+        grade: The target grade level.
+        topic: The math topic.
+        llm: Optional LLM instance.
+        num_problems: Number of problems to generate.
+
+    Returns:
+        The generate_problems result for the topic.
+    """
+    crew = MathProblemsCrew(grade=grade, topic=topic, llm=llm, verbose=False)
+    return crew.generate_problems(
+        num_problems=num_problems,
+        include_hints=True,
+        include_review=True,
+    )
+
+
 def generate_problems_for_grade(
     grade: GradeLevel,
     num_problems_per_topic: int = 3,
@@ -305,6 +370,9 @@ def generate_problems_for_grade(
 ) -> dict[str, Any]:
     """Generate problems for all appropriate topics for a grade.
 
+    Topics are generated concurrently, since each one mostly waits on the LLM
+    API; results are keyed in curriculum order.
+
     Args:
         grade: The target grade level.
         num_problems_per_topic: Number of problems per topic.
@@ -318,14 +386,15 @@ def generate_problems_for_grade(
         "grade": grade.value,
         "topics": {},
     }
-
-    for topic in topics:
-        crew = MathProblemsCrew(grade=grade, topic=topic, llm=llm, verbose=False)
-        topic_result = crew.generate_problems(
-            num_problems=num_problems_per_topic,
-            include_hints=True,
-            include_review=True,
-        )
-        results["topics"][topic.value] = topic_result
+    if not topics:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(len(topics), _MAX_TOPIC_WORKERS)) as executor:
+        futures = [
+            executor.submit(_run_one, grade, topic, llm, num_problems_per_topic)
+            for topic in topics
+        ]
+        for topic, future in zip(topics, futures, strict=True):
+            results["topics"][topic.value] = future.result()
 
     return results
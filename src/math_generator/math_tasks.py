@@ -4,6 +4,87 @@ from crewai import Agent, Task
 
 from math_generator.math_concepts import GradeLevel, MathTopic
 
+# Concept explanation task description
+_CONCEPT_DESC_TMPL = """Explain the math concept of {topic_name} for {grade_name} students.
+
+Your explanation should include:
+1. A simple, age-appropriate definition
+2. Why this concept is important
+3. Real-world examples children can relate to
+4. Common misconceptions to avoid
+5. Tips for understanding the concept better
+
+Keep the language simple and engaging for young learners."""
+
+# Problem generation task description
+_GENERATION_DESC_TMPL = """Generate {num_problems} math problems about {topic_name} \
+for {grade_name} students at difficulty level {difficulty} (out of 5).
+
+For each problem, provide:
+1. The question (clear and age-appropriate)
+2. The correct answer
+3. A brief explanation of how to solve it
+
+Guidelines:
+- Use simple, clear language
+- Include relatable scenarios (toys, animals, food, games)
+- Vary the problem types within the topic
+- Ensure mathematical accuracy
+- Make problems progressively slightly harder
+
+Format each problem as:
+Problem [number]:
+Question: [question text]
+Answer: [answer]
+Explanation: [step-by-step solution]"""
+
+# Problem review task description
+_REVIEW_DESC_TMPL = """Review the generated {topic_name} problems for {grade_name} students.
+
+For each problem, verify:
+1. Mathematical accuracy - Is the answer correct?
+2. Age appropriateness - Is it suitable for {grade_name}?
+3. Clarity - Is the question clearly worded?
+4. Difficulty - Is it at the right level?
+5. Educational value - Does it help learn the concept?
+
+Provide:
+- Overall quality assessment (pass/needs revision)
+- Specific feedback for any problems that need improvement
+- Suggested corrections if errors are found"""
+
+# Hint generation task description
+_HINT_DESC_TMPL = """Create helpful hints for the {topic_name} problems \
+designed for {grade_name} students.
+
+For each problem, create 2-3 hints that:
+1. Guide students toward the solution without giving it away
+2. Break down the problem into smaller steps
+3. Use simple language appropriate for {grade_name}
+4. Encourage critical thinking
+5. Build confidence
+
+Hints should be progressive:
+- Hint 1: A gentle nudge in the right direction
+- Hint 2: A more specific strategy
+- Hint 3: A detailed step to help stuck students"""
+
+# Worksheet compilation task description
+_WORKSHEET_DESC_TMPL = """Compile a complete {topic_name} worksheet for {grade_name} students.
+
+The worksheet should include:
+1. A title and brief introduction
+2. A quick concept review section
+3. The practice problems (organized by difficulty)
+4. An answer key section
+5. A "Challenge Yourself" bonus section
+
+Format the worksheet in a clear, printable format with:
+- Clear section headers
+- Numbered problems
+- Space indicators for student work
+- Encouraging messages throughout"""
+
 
 def create_concept_explanation_task(
     agent: Agent,
@@ -20,19 +101,9 @@ def create_concept_explanation_task(
     Returns:
         A CrewAI Task for concept explanation.
     """
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
-
-    description = f"""Explain the math concept of {topic_name} for {grade_name} students.
-
-Your explanation should include:
-1. A simple, age-appropriate definition
-2. Why this concept is important
-3. Real-world examples children can relate to
-4. Common misconceptions to avoid
-5. Tips for understanding the concept better
+    topic_name, grade_name = topic.display_name, grade.display_name
 
-Keep the language simple and engaging for young learners."""
+    description = _CONCEPT_DESC_TMPL.format(topic_name=topic_name, grade_name=grade_name)
 
     expected_output = (
         f"A clear, engaging explanation of {topic_name} suitable for "
@@ -65,29 +136,14 @@ def create_problem_generation_task(
     Returns:
         A CrewAI Task for problem generation.
     """
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
-
-    description = f"""Generate {num_problems} math problems about {topic_name} \
-for {grade_name} students at difficulty level {difficulty} (out of 5).
-
-For each problem, provide:
-1. The question (clear and age-appropriate)
-2. The correct answer
-3. A brief explanation of how to solve it
+    topic_name, grade_name = topic.display_name, grade.display_name
 
-Guidelines:
-- Use simple, clear language
-- Include relatable scenarios (toys, animals, food, games)
-- Vary the problem types within the topic
-- Ensure mathematical accuracy
-- Make problems progressively slightly harder
-
-Format each problem as:
-Problem [number]:
-Question: [question text]
-Answer: [answer]
-Explanation: [step-by-step solution]"""
+    description = _GENERATION_DESC_TMPL.format(
+        num_problems=num_problems,
+        topic_name=topic_name,
+        grade_name=grade_name,
+        difficulty=difficulty,
+    )
 
     expected_output = (
         f"{num_problems} well-formatted math problems about {topic_name} "
@@ -118,22 +174,9 @@ def create_problem_review_task(
     Returns:
         A CrewAI Task for problem review.
     """
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
+    topic_name, grade_name = topic.display_name, grade.display_name
 
-    description = f"""Review the generated {topic_name} problems for {grade_name} students.
-
-For each problem, verify:
-1. Mathematical accuracy - Is the answer correct?
-2. Age appropriateness - Is it suitable for {grade_name}?
-3. Clarity - Is the question clearly worded?
-4. Difficulty - Is it at the right level?
-5. Educational value - Does it help learn the concept?
-
-Provide:
-- Overall quality assessment (pass/needs revision)
-- Specific feedback for any problems that need improvement
-- Suggested corrections if errors are found"""
+    description = _REVIEW_DESC_TMPL.format(topic_name=topic_name, grade_name=grade_name)
 
     expected_output = (
         f"A detailed review of the {topic_name} problems, including "
@@ -165,23 +208,9 @@ def create_hint_generation_task(
     Returns:
         A CrewAI Task for hint generation.
     """
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
-
-    description = f"""Create helpful hints for the {topic_name} problems \
-designed for {grade_name} students.
-
-For each problem, create 2-3 hints that:
-1. Guide students toward the solution without giving it away
-2. Break down the problem into smaller steps
-3. Use simple language appropriate for {grade_name}
-4. Encourage critical thinking
-5. Build confidence
+    topic_name, grade_name = topic.display_name, grade.display_name
 
-Hints should be progressive:
-- Hint 1: A gentle nudge in the right direction
-- Hint 2: A more specific strategy
-- Hint 3: A detailed step to help stuck students"""
+    description = _HINT_DESC_TMPL.format(topic_name=topic_name, grade_name=grade_name)
 
     expected_output = (
         f"2-3 progressive hints for each {topic_name} problem, "
@@ -213,23 +242,9 @@ def create_worksheet_compilation_task(
     Returns:
         A CrewAI Task for worksheet compilation.
     """
-    topic_name = topic.value.replace("_", " ")
-    grade_name = grade.value.replace("_", " ")
-
-    description = f"""Compile a complete {topic_name} worksheet for {grade_name} students.
+    topic_name, grade_name = topic.display_name, grade.display_name
 
-The worksheet should include:
-1. A title and brief introduction
-2. A quick concept review section
-3. The practice problems (organized by difficulty)
-4. An answer key section
-5. A "Challenge Yourself" bonus section
-
-Format the worksheet in a clear, printable format with:
-- Clear section headers
-- Numbered problems
-- Space indicators for student work
-- Encouraging messages throughout"""
+    description = _WORKSHEET_DESC_TMPL.format(topic_name=topic_name, grade_name=grade_name)
 
     expected_output = (
         f"A complete, well-formatted {topic_name} worksheet for "
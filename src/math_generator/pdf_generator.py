@@ -1,13 +1,15 @@
 """PDF generation module for math problems and worksheets."""
 
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     PageBreak,
@@ -20,95 +22,196 @@ from reportlab.platypus import (
 
 from math_generator.math_concepts import GradeLevel, MathTopic
 
+# Line tags produced by _classify_lines
+_PROBLEM = "problem"
+_QUESTION = "question"
+_ANSWER = "answer"
+_EXPLANATION = "explanation"
+_HINT = "hint"
+_OTHER = "other"
+
+# Recognized line prefixes, one capture group per tag (group N is _LINE_TAGS[N - 1])
+_LINE_RE = re.compile(r"(Problem )|(Question:)|(Answer:)|(Explanation:)|(Hint)")
+_LINE_TAGS: tuple[str, ...] = (_PROBLEM, _QUESTION, _ANSWER, _EXPLANATION, _HINT)
+
+# Reviewer remarks that leak into the generated text and are left out of the PDF
+_PROBLEM_SKIP_RE = re.compile("quality|verified|assessment", re.IGNORECASE)
+_HINT_SKIP_RE = re.compile("quality|assessment", re.IGNORECASE)
+
+# Static student information block at the top of every worksheet. Table
+# flowables are mutated during layout, so only the rows and style are shared.
+_STUDENT_INFO_ROWS = (
+    ("Name: _________________________", "Date: _________________________"),
+    ("Grade: _________________________", "Score: _________________________"),
+)
+_STUDENT_INFO_STYLE = TableStyle(
+    [
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+    ]
+)
+
+# Worksheet sections that start the answer key or act as plain-text headers
+_ANSWER_KEY_RE = re.compile("answer key", re.IGNORECASE)
+_WORKSHEET_HEADER_RE = re.compile(
+    "let's practice:|concept review:|challenge yourself:", re.IGNORECASE
+)
+
+
+def _classify_lines(text: str) -> list[tuple[str, str]]:
+    """Split LLM output into stripped, non-empty lines tagged by their prefix.
+
+    Args:
+        text: Text containing problems, answers or hints.
+
+    Returns:
+        List of (tag, line) pairs, where tag is one of the line tag constants.
+    """
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = _LINE_RE.match(line)
+        tag = _LINE_TAGS[match.lastindex - 1] if match and match.lastindex else _OTHER
+        lines.append((tag, line))
+    return lines
+
+
+@lru_cache(maxsize=256)
+def _display_name(value: str) -> str:
+    """Turn a grade or topic value such as ``"grade_1"`` into ``"Grade 1"``.
+
+    Args:
+        value: Grade or topic value.
+
+    Returns:
+        Title-cased name with underscores replaced by spaces.
+    """
+    return value.replace("_", " ").title()
+
+
+@lru_cache(maxsize=1)
+def _build_stylesheet() -> StyleSheet1:
+    """Build the sample stylesheet extended with the custom PDF styles.
+
+    The stylesheet is built once and shared by every MathPDFGenerator, so it
+    must be treated as read-only.
+
+    Returns:
+        The shared stylesheet.
+    """
+    styles = getSampleStyleSheet()
+
+    # Title style
+    styles.add(
+        ParagraphStyle(
+            name="CustomTitle",
+            parent=styles["Title"],
+            fontSize=18,
+            textColor=colors.HexColor("#2E86AB"),
+            spaceAfter=15,
+            alignment=1,  # Center
+        )
+    )
+
+    # Section heading style
+    styles.add(
+        ParagraphStyle(
+            name="SectionHeading",
+            parent=styles["Heading1"],
+            fontSize=14,
+            textColor=colors.HexColor("#A23B72"),
+            spaceAfter=12,
+            spaceBefore=12,
+        )
+    )
+
+    # Problem style
+    styles.add(
+        ParagraphStyle(
+            name="Problem",
+            parent=styles["Normal"],
+            fontSize=12,
+            spaceAfter=12,
+            spaceBefore=6,
+            leftIndent=20,
+            leading=16,
+        )
+    )
+
+    # Answer style
+    styles.add(
+        ParagraphStyle(
+            name="Answer",
+            parent=styles["Normal"],
+            fontSize=11,
+            textColor=colors.HexColor("#18A558"),
+            leftIndent=30,
+            spaceAfter=6,
+        )
+    )
+
+    # Hint style
+    styles.add(
+        ParagraphStyle(
+            name="Hint",
+            parent=styles["Normal"],
+            fontSize=10,
+            textColor=colors.HexColor("#F77F00"),
+            leftIndent=30,
+            spaceAfter=6,
+            fontName="Helvetica-Oblique",
+        )
+    )
+
+    # Concept style
+    styles.add(
+        ParagraphStyle(
+            name="Concept",
+            parent=styles["Normal"],
+            fontSize=11,
+            spaceAfter=10,
+            leftIndent=15,
+        )
+    )
+
+    return styles
+
 
 class MathPDFGenerator:
     """Generate structured PDF documents for math problems and concepts."""
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str | Path | None = "output"):
         """Initialize the PDF generator.
 
         Args:
-            output_dir: Directory to save generated PDFs.
+            output_dir: Directory to save generated PDFs, or None for a
+                generator that only writes to streams.
         """
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self) -> None:
-        """Set up custom paragraph styles for the PDF."""
-        # Title style
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomTitle",
-                parent=self.styles["Title"],
-                fontSize=18,
-                textColor=colors.HexColor("#2E86AB"),
-                spaceAfter=15,
-                alignment=1,  # Center
-            )
-        )
-
-        # Section heading style
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionHeading",
-                parent=self.styles["Heading1"],
-                fontSize=14,
-                textColor=colors.HexColor("#A23B72"),
-                spaceAfter=12,
-                spaceBefore=12,
-            )
-        )
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.styles = _build_stylesheet()
 
-        # Problem style
-        self.styles.add(
-            ParagraphStyle(
-                name="Problem",
-                parent=self.styles["Normal"],
-                fontSize=12,
-                spaceAfter=12,
-                spaceBefore=6,
-                leftIndent=20,
-                leading=16,
-            )
-        )
+    def _target(self, filename: str, stream: BinaryIO | None) -> str | BinaryIO:
+        """Resolve where a document is written.
 
-        # Answer style
-        self.styles.add(
-            ParagraphStyle(
-                name="Answer",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=colors.HexColor("#18A558"),
-                leftIndent=30,
-                spaceAfter=6,
-            )
-        )
+        Args:
+            filename: Generated filename for the document.
+            stream: Optional binary stream to write to instead of a file.
 
-        # Hint style
-        self.styles.add(
-            ParagraphStyle(
-                name="Hint",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                textColor=colors.HexColor("#F77F00"),
-                leftIndent=30,
-                spaceAfter=6,
-                fontName="Helvetica-Oblique",
-            )
-        )
+        Returns:
+            The stream if given, otherwise the file path in the output directory.
 
-        # Concept style
-        self.styles.add(
-            ParagraphStyle(
-                name="Concept",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                spaceAfter=10,
-                leftIndent=15,
-            )
-        )
+        Raises:
+            ValueError: If no stream is given and the generator has no output directory.
+        """
+        if stream is not None:
+            return stream
+        if self.output_dir is None:
+            raise ValueError("An output directory is required to write PDF files")
+        return str(self.output_dir / filename)
 
     def _get_filename(
         self,
@@ -116,6 +219,7 @@ class MathPDFGenerator:
         topic: str,
         doc_type: str = "problems",
         frequency: str = "daily",
+        now: datetime | None = None,
     ) -> str:
         """Generate a filename for the PDF.
 
@@ -124,11 +228,12 @@ class MathPDFGenerator:
             topic: Math topic.
             doc_type: Type of document (problems, worksheet, concepts).
             frequency: Frequency indicator (daily, weekly).
+            now: Timestamp for the filename. Defaults to the current time.
 
         Returns:
             Filename string.
         """
-        timestamp = datetime.now().strftime("%Y%m%d")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d")
         safe_topic = topic.replace(" ", "_").replace("/", "_")
         return f"{grade}_{safe_topic}_{doc_type}_{frequency}_{timestamp}.pdf"
 
@@ -138,6 +243,7 @@ class MathPDFGenerator:
         frequency: str = "daily",
         include_answers: bool = True,
         include_hints: bool = True,
+        stream: BinaryIO | None = None,
     ) -> str:
         """Generate a PDF document for math problems.
 
@@ -146,28 +252,32 @@ class MathPDFGenerator:
             frequency: 'daily' or 'weekly' to indicate the frequency.
             include_answers: Whether to include answer key.
             include_hints: Whether to include hints.
+            stream: Optional binary stream to write the PDF to instead of a file.
 
         Returns:
-            Path to the generated PDF file.
+            Path to the generated PDF file, or just its filename when written
+            to ``stream``.
         """
         grade = data.get("grade", "unknown")
         topic = data.get("topic", "unknown")
-        filename = self._get_filename(grade, topic, "problems", frequency)
-        filepath = self.output_dir / filename
+        now = datetime.now()
+        filename = self._get_filename(grade, topic, "problems", frequency, now)
+        target = self._target(filename, stream)
+        topic_name = _display_name(topic)
 
         # Create PDF document
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
+        doc = SimpleDocTemplate(target, pagesize=letter)
         story = []
 
         # Title
-        title_text = f"Math Problems - {topic.replace('_', ' ').title()}"
+        title_text = f"Math Problems - {topic_name}"
         story.append(Paragraph(title_text, self.styles["CustomTitle"]))
 
         # Metadata
         metadata = [
-            f"<b>Grade:</b> {grade.replace('_', ' ').title()}",
-            f"<b>Topic:</b> {topic.replace('_', ' ').title()}",
-            f"<b>Date:</b> {datetime.now().strftime('%B %d, %Y')}",
+            f"<b>Grade:</b> {_display_name(grade)}",
+            f"<b>Topic:</b> {topic_name}",
+            f"<b>Date:</b> {now.strftime('%B %d, %Y')}",
             f"<b>Frequency:</b> {frequency.title()}",
         ]
         for meta in metadata:
@@ -183,8 +293,13 @@ class MathPDFGenerator:
             problems_text = data["tasks_output"][0]  # First task is problem generation
         else:
             problems_text = data.get("result", "")
-        
-        self._add_problems_from_text(story, problems_text)
+
+        # Classify the problem lines once for both the problems and answer key sections
+        problem_lines = _classify_lines(problems_text)
+        if problems_text:
+            self._add_problems(story, problem_lines)
+        else:
+            story.append(Paragraph("No problems generated.", self.styles["Normal"]))
 
         # Add hints section if requested
         if include_hints and "tasks_output" in data and len(data["tasks_output"]) >= 3:
@@ -193,62 +308,53 @@ class MathPDFGenerator:
             story.append(Spacer(1, 0.2 * inch))
             # Hints are in the last task output
             hints_text = data["tasks_output"][-1]
-            self._add_hints_from_text(story, hints_text)
+            self._add_hints(story, _classify_lines(hints_text))
 
         # Add answer key if requested
         if include_answers:
             story.append(PageBreak())
             story.append(Paragraph("Answer Key", self.styles["SectionHeading"]))
             story.append(Spacer(1, 0.2 * inch))
-            self._add_answers_from_text(story, problems_text)
+            self._add_answers(story, problem_lines)
 
         # Build PDF
         doc.build(story)
-        return str(filepath)
+        return filename if stream is not None else str(target)
 
     def generate_worksheet_pdf(
         self,
         data: dict[str, Any],
         frequency: str = "weekly",
+        stream: BinaryIO | None = None,
     ) -> str:
         """Generate a PDF worksheet with concepts and problems.
 
         Args:
             data: Dictionary containing worksheet data from MathProblemsCrew.
             frequency: 'daily' or 'weekly' to indicate the frequency.
+            stream: Optional binary stream to write the PDF to instead of a file.
 
         Returns:
-            Path to the generated PDF file.
+            Path to the generated PDF file, or just its filename when written
+            to ``stream``.
         """
         grade = data.get("grade", "unknown")
         topic = data.get("topic", "unknown")
-        filename = self._get_filename(grade, topic, "worksheet", frequency)
-        filepath = self.output_dir / filename
+        now = datetime.now()
+        filename = self._get_filename(grade, topic, "worksheet", frequency, now)
+        target = self._target(filename, stream)
 
         # Create PDF document
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
+        doc = SimpleDocTemplate(target, pagesize=letter)
         story = []
 
         # Title
-        title_text = f"{topic.replace('_', ' ').title()} Worksheet"
+        title_text = f"{_display_name(topic)} Worksheet"
         story.append(Paragraph(title_text, self.styles["CustomTitle"]))
 
         # Student information section
-        student_info = Table(
-            [
-                ["Name: _________________________", "Date: _________________________"],
-                ["Grade: _________________________", "Score: _________________________"],
-            ],
-            colWidths=[3 * inch, 3 * inch],
-        )
-        student_info.setStyle(
-            TableStyle(
-                [
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-                ]
-            )
-        )
+        student_info = Table(_STUDENT_INFO_ROWS, colWidths=[3 * inch, 3 * inch])
+        student_info.setStyle(_STUDENT_INFO_STYLE)
         story.append(student_info)
         story.append(Spacer(1, 0.3 * inch))
 
@@ -261,39 +367,43 @@ class MathPDFGenerator:
 
         # Build PDF
         doc.build(story)
-        return str(filepath)
+        return filename if stream is not None else str(target)
 
     def generate_concept_pdf(
         self,
         data: dict[str, Any],
         frequency: str = "weekly",
+        stream: BinaryIO | None = None,
     ) -> str:
         """Generate a PDF for concept explanation.
 
         Args:
             data: Dictionary containing concept explanation data.
             frequency: 'daily' or 'weekly' to indicate the frequency.
+            stream: Optional binary stream to write the PDF to instead of a file.
 
         Returns:
-            Path to the generated PDF file.
+            Path to the generated PDF file, or just its filename when written
+            to ``stream``.
         """
         grade = data.get("grade", "unknown")
         topic = data.get("topic", "unknown")
-        filename = self._get_filename(grade, topic, "concepts", frequency)
-        filepath = self.output_dir / filename
+        now = datetime.now()
+        filename = self._get_filename(grade, topic, "concepts", frequency, now)
+        target = self._target(filename, stream)
 
         # Create PDF document
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
+        doc = SimpleDocTemplate(target, pagesize=letter)
         story = []
 
         # Title
-        title_text = f"Understanding {topic.replace('_', ' ').title()}"
+        title_text = f"Understanding {_display_name(topic)}"
         story.append(Paragraph(title_text, self.styles["CustomTitle"]))
 
         # Metadata
         metadata = [
-            f"<b>Grade Level:</b> {grade.replace('_', ' ').title()}",
-            f"<b>Date:</b> {datetime.now().strftime('%B %d, %Y')}",
+            f"<b>Grade Level:</b> {_display_name(grade)}",
+            f"<b>Date:</b> {now.strftime('%B %d, %Y')}",
         ]
         for meta in metadata:
             story.append(Paragraph(meta, self.styles["Normal"]))
@@ -331,116 +441,103 @@ class MathPDFGenerator:
 
         # Build PDF
         doc.build(story)
-        return str(filepath)
+        return filename if stream is not None else str(target)
 
-    def _add_problems_from_text(self, story: list, text: str) -> None:
-        """Parse and add problems from text to the story.
+    def _add_problems(self, story: list, lines: list[tuple[str, str]]) -> None:
+        """Add problems from classified lines to the story.
 
         Args:
             story: List of reportlab flowables.
-            text: Text containing problems.
+            lines: Lines of the problems text, as returned by ``_classify_lines``.
         """
-        if not text:
-            story.append(Paragraph("No problems generated.", self.styles["Normal"]))
-            return
-
-        # Split into lines and process
-        lines = text.split("\n")
+        problem_style = self.styles["Problem"]
+        # Collect the problem texts first and build the flowables in one pass
+        problem_texts = []
         current_problem = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
+
+        for tag, line in lines:
             # Check if this is a new problem
-            if line.startswith("Problem "):
+            if tag == _PROBLEM:
                 # Add previous problem if exists
                 if current_problem:
-                    problem_text = "<br/>".join(current_problem)
-                    story.append(Paragraph(problem_text, self.styles["Problem"]))
-                    story.append(Spacer(1, 0.2 * inch))
+                    problem_texts.append("<br/>".join(current_problem))
                     current_problem = []
                 current_problem.append(f"<b>{line}</b>")
-            elif line.startswith("Question:"):
+            elif tag == _QUESTION:
                 current_problem.append(line)
-            elif line.startswith("Answer:"):
-                # Don't add answers in the problems section
-                pass
-            elif line.startswith("Explanation:"):
-                # Don't add explanations in the problems section
+            elif tag in (_ANSWER, _EXPLANATION):
+                # Don't add answers or explanations in the problems section
                 pass
-            else:
+            elif current_problem and not _PROBLEM_SKIP_RE.search(line):
                 # Add other lines that are part of the question
-                if current_problem and not any(x in line.lower() for x in ['quality', 'verified', 'assessment']):
-                    current_problem.append(line)
-        
+                current_problem.append(line)
+
         # Add the last problem
         if current_problem:
-            problem_text = "<br/>".join(current_problem)
-            story.append(Paragraph(problem_text, self.styles["Problem"]))
-            story.append(Spacer(1, 0.2 * inch))
+            problem_texts.append("<br/>".join(current_problem))
 
-    def _add_answers_from_text(self, story: list, text: str) -> None:
-        """Parse and add answers from text to the story.
+        for problem_text in problem_texts:
+            story += (Paragraph(problem_text, problem_style), Spacer(1, 0.2 * inch))
+
+    def _add_answers(self, story: list, lines: list[tuple[str, str]]) -> None:
+        """Add answers from classified lines to the story.
 
         Args:
             story: List of reportlab flowables.
-            text: Text containing answers.
+            lines: Lines of the problems text, as returned by ``_classify_lines``.
         """
-        if not text:
-            return
-            
-        lines = text.split("\n")
+        answer_style = self.styles["Answer"]
+        normal_style = self.styles["Normal"]
+        # Parallel text/style lists, turned into paragraphs in one pass
+        texts = []
+        styles = []
         current_problem_num = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
+
+        for tag, line in lines:
             # Track problem numbers
-            if line.startswith("Problem "):
+            if tag == _PROBLEM:
                 current_problem_num = line
-                story.append(Paragraph(f"<b>{line}</b>", self.styles["Answer"]))
-            elif line.startswith("Answer:"):
-                story.append(Paragraph(line, self.styles["Answer"]))
-            elif line.startswith("Explanation:"):
-                # Get the full explanation
-                story.append(Paragraph(line, self.styles["Answer"]))
-            elif current_problem_num and line.startswith("Question:"):
+                texts.append(f"<b>{line}</b>")
+                styles.append(answer_style)
+            elif tag in (_ANSWER, _EXPLANATION):
+                texts.append(line)
+                styles.append(answer_style)
+            elif current_problem_num and tag == _QUESTION:
                 # Show the question in answer key too
-                story.append(Paragraph(line, self.styles["Normal"]))
+                texts.append(line)
+                styles.append(normal_style)
+
+        story.extend(map(Paragraph, texts, styles))
 
-    def _add_hints_from_text(self, story: list, text: str) -> None:
-        """Parse and add hints from text to the story.
+    def _add_hints(self, story: list, lines: list[tuple[str, str]]) -> None:
+        """Add hints from classified lines to the story.
 
         Args:
             story: List of reportlab flowables.
-            text: Text containing hints.
+            lines: Lines of the hints text, as returned by ``_classify_lines``.
         """
-        if not text:
-            return
-            
-        lines = text.split("\n")
+        hint_style = self.styles["Hint"]
+        # Hint texts in order, with None marking the gap between two problems
+        texts: list[str | None] = []
         current_problem = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
+
+        for tag, line in lines:
             # Track problem numbers
-            if line.startswith("Problem "):
+            if tag == _PROBLEM:
                 if current_problem:
-                    story.append(Spacer(1, 0.15 * inch))
+                    texts.append(None)
                 current_problem = line
-                story.append(Paragraph(f"<b>{line}</b>", self.styles["Hint"]))
-            elif line.startswith("Hint"):
-                story.append(Paragraph(f"💡 {line}", self.styles["Hint"]))
-            elif current_problem and line and not any(x in line.lower() for x in ['quality', 'assessment']):
+                texts.append(f"<b>{line}</b>")
+            elif tag == _HINT:
+                texts.append(f"💡 {line}")
+            elif current_problem and not _HINT_SKIP_RE.search(line):
                 # Add continuation of hint text
-                story.append(Paragraph(line, self.styles["Hint"]))
+                texts.append(line)
+
+        story.extend(
+            Spacer(1, 0.15 * inch) if text is None else Paragraph(text, hint_style)
+            for text in texts
+        )
 
     def _add_worksheet_content(self, story: list, text: str) -> None:
         """Parse and add worksheet content to the story.
@@ -461,7 +558,7 @@ class MathPDFGenerator:
                 continue
                 
             # Check if this is the answer key section
-            if "answer key" in section.lower():
+            if _ANSWER_KEY_RE.search(section):
                 in_answer_section = True
                 continue
             
@@ -471,7 +568,10 @@ class MathPDFGenerator:
             else:
                 questions_content.append(section)
         
-        # Add questions/problems section
+        # Add questions/problems section as (style, texts, spaced) runs;
+        # consecutive plain sections share a run and are laid out as a single
+        # paragraph, and a header is kept directly above its own content
+        runs: list[tuple[str, list[str], bool]] = []
         for section in questions_content:
             # Check if section starts with markdown bold headers
             # (e.g., **Title:** or **Introduction:**)
@@ -479,40 +579,32 @@ class MathPDFGenerator:
                 # Parse header and content separately
                 lines = section.split("\n", 1)
                 header = lines[0].strip("*").strip()
-                
-                # Add header in SectionHeading style
-                story.append(Paragraph(header, self.styles["SectionHeading"]))
-                
-                # Add remaining content in Normal style if present
-                if len(lines) > 1:
-                    content = lines[1].strip()
-                    if content:
-                        story.append(Paragraph(content, self.styles["Normal"]))
+                content = lines[1].strip() if len(lines) > 1 else ""
+
+                # Header in SectionHeading style, remaining content in Normal style
+                runs.append(("SectionHeading", [header], not content))
+                if content:
+                    runs.append(("Normal", [content], True))
+            elif _WORKSHEET_HEADER_RE.search(section):
+                # Keyword-based headers without markdown
+                runs.append(("SectionHeading", [section], True))
+            elif runs and runs[-1][0] == "Normal":
+                runs[-1][1].append(section)
             else:
-                # Check for keyword-based headers without markdown
-                is_header = any(
-                    keyword in section.lower()
-                    for keyword in [
-                        "let's practice:",
-                        "concept review:",
-                        "challenge yourself:",
-                    ]
-                )
-                
-                if is_header:
-                    story.append(Paragraph(section, self.styles["SectionHeading"]))
-                else:
-                    story.append(Paragraph(section, self.styles["Normal"]))
-            
-            story.append(Spacer(1, 0.15 * inch))
-        
+                runs.append(("Normal", [section], True))
+
+        spacer_height = 0.15 * inch
+        for style_name, texts, spaced in runs:
+            story.append(Paragraph("<br/><br/>".join(texts), self.styles[style_name]))
+            if spaced:
+                story.append(Spacer(1, spacer_height))
+
         # Add page break before answers
         if answers_content:
             story.append(PageBreak())
             story.append(Paragraph("Answer Key", self.styles["SectionHeading"]))
             story.append(Spacer(1, 0.2 * inch))
-            
+
             # Add answer content
-            for section in answers_content:
-                story.append(Paragraph(section, self.styles["Normal"]))
-                story.append(Spacer(1, 0.15 * inch))
+            story.append(Paragraph("<br/><br/>".join(answers_content), self.styles["Normal"]))
+            story.append(Spacer(1, spacer_height))
@@ -1,22 +1,34 @@
 """Tests for AWS Lambda handler."""
 
+import base64
 import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Skip all tests in this file since we're using OpenAI instead of AWS Bedrock
-# AWS Lambda can still be used with OpenAI, but tests need to be updated
-pytestmark = pytest.mark.skip(reason="AWS Lambda tests not updated for OpenAI integration")
-
 from math_generator.aws_lambda import (
     _error_response,
+    _param,
     _success_response,
     health_check,
     lambda_handler,
 )
 
 
+class TestParam:
+    """Tests for _param helper."""
+
+    def test_falsy_body_value_is_kept(self) -> None:
+        """Test that a falsy body value is not replaced by the query string or default."""
+        assert _param({"num_problems": 0}, {"num_problems": "3"}, "num_problems", 5, int) == 0
+
+    def test_falls_back_to_query_then_default(self) -> None:
+        """Test that a missing body value falls back to the query string, then the default."""
+        assert _param({}, {"num_problems": "3"}, "num_problems", 5, int) == 3
+        assert _param({"grade": None}, {}, "grade", "grade_1", str) == "grade_1"
+
+
 class TestSuccessResponse:
     """Tests for _success_response function."""
 
@@ -104,6 +116,26 @@ class TestLambdaHandler:
         assert response["statusCode"] == 200
         mock_crew.generate_problems.assert_called_once()
 
+    @patch("math_generator.aws_lambda.MathProblemsCrew")
+    def test_handler_returns_pdf_in_memory(
+        self, mock_crew_class: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the handler returns the rendered PDF without writing to disk."""
+        monkeypatch.chdir(tmp_path)
+        mock_crew_class.return_value.generate_problems.return_value = {
+            "grade": "grade_1",
+            "topic": "addition",
+            "tasks_output": ["Problem 1:\nQuestion: 2 + 3?\nAnswer: 5\nExplanation: Add."],
+        }
+
+        response = lambda_handler({"body": json.dumps({"grade": "grade_1"})}, None)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert base64.b64decode(body["pdf_base64"]).startswith(b"%PDF")
+        assert body["pdf_filename"].startswith("grade_1_addition_problems_daily_")
+        assert list(tmp_path.iterdir()) == []
+
     @patch("math_generator.aws_lambda.MathProblemsCrew")
     def test_handler_with_query_params(self, mock_crew_class: MagicMock) -> None:
         """Test handler with query string parameters."""
@@ -187,6 +219,23 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert "number of problems" in body["error"].lower()
 
+    def test_handler_with_zero_num_problems(self) -> None:
+        """Test that an explicit zero is validated rather than replaced by the default."""
+        event = {
+            "body": json.dumps(
+                {
+                    "grade": "grade_1",
+                    "topic": "addition",
+                    "num_problems": 0,
+                }
+            )
+        }
+        response = lambda_handler(event, None)
+
+        assert response["statusCode"] == 400
+        body = json.loads(response["body"])
+        assert "number of problems" in body["error"].lower()
+
     @patch("math_generator.aws_lambda.MathProblemsCrew")
     def test_handler_explain_action(self, mock_crew_class: MagicMock) -> None:
         """Test handler with explain action."""
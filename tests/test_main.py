@@ -0,0 +1,23 @@
+"""Tests for the CLI entry point module."""
+
+import pytest
+
+from math_generator import main
+from math_generator.main import format_output_bytes
+
+
+class TestFormatOutputBytes:
+    """Tests for format_output_bytes function."""
+
+    def test_json_matches_with_and_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that JSON output keeps non-ASCII text and does not depend on orjson."""
+        pytest.importorskip("orjson")
+        result = {"grade": "grade_3", "result": "Problem 1:\nQuestion: 6 × 2 ÷ 3 = ?", "count": 1}
+
+        monkeypatch.setattr(main, "_HAS_ORJSON", False)
+        fallback = format_output_bytes(result, "json")
+        monkeypatch.setattr(main, "_HAS_ORJSON", True)
+        with_orjson = format_output_bytes(result, "json")
+
+        assert "6 × 2 ÷ 3".encode() in fallback
+        assert fallback == with_orjson
@@ -1,6 +1,11 @@
 """Tests for math agents module."""
 
+import pytest
+from crewai import Agent
+
 from math_generator.math_agents import (
+    build_agent,
+    build_all_agents,
     create_hint_provider,
     create_math_concept_expert,
     create_problem_generator,
@@ -25,6 +30,25 @@ class TestGetLLM:
         llm = get_llm(model_id="gpt-3.5-turbo")
         assert "gpt-3.5-turbo" in llm.model
 
+    def test_get_llm_with_custom_provider(self) -> None:
+        """Test get_llm with an explicit provider prefix."""
+        llm = get_llm(model_id="gpt-4o", provider="azure")
+        assert llm.model == "azure/gpt-4o"
+        assert llm is not get_llm(model_id="gpt-4o", provider="openai")
+
+    def test_get_llm_reuses_instance_per_model(self) -> None:
+        """Test that get_llm returns a shared instance for the same model."""
+        assert get_llm(model_id="gpt-4o") is get_llm(model_id="gpt-4o")
+        assert get_llm(model_id="gpt-4o") is not get_llm(model_id="gpt-3.5-turbo")
+
+    def test_get_llm_marks_system_prompt_cacheable(self) -> None:
+        """Test that cache_control is only requested from providers that need it."""
+        llm = get_llm(model_id="claude-3-5-sonnet-20240620", provider="anthropic")
+        assert llm.additional_params["cache_control_injection_points"] == [
+            {"location": "message", "role": "system"}
+        ]
+        assert "cache_control_injection_points" not in get_llm().additional_params
+
 
 class TestCreateMathConceptExpert:
     """Tests for create_math_concept_expert function."""
@@ -36,8 +60,9 @@ class TestCreateMathConceptExpert:
             topic=MathTopic.ADDITION,
         )
         assert agent.role == "Mathematics Concept Expert"
-        assert "addition" in agent.goal.lower()
-        assert "grade 1" in agent.goal.lower()
+        goal = agent.goal.lower()
+        assert "addition" in goal
+        assert "grade 1" in goal
 
     def test_create_agent_with_custom_llm(self) -> None:
         """Test creating agent with custom LLM."""
@@ -55,8 +80,9 @@ class TestCreateMathConceptExpert:
             grade=GradeLevel.GRADE_2,
             topic=MathTopic.SUBTRACTION,
         )
-        assert "grade 2" in agent.backstory.lower()
-        assert "subtraction" in agent.backstory.lower()
+        backstory = agent.backstory.lower()
+        assert "grade 2" in backstory
+        assert "subtraction" in backstory
 
 
 class TestCreateProblemGenerator:
@@ -71,15 +97,18 @@ class TestCreateProblemGenerator:
         assert agent.role == "Mathematics Problem Generator"
         assert "addition" in agent.goal.lower()
 
-    def test_agent_for_different_topics(self) -> None:
+    @pytest.mark.parametrize(
+        "topic",
+        [MathTopic.ADDITION, MathTopic.MULTIPLICATION, MathTopic.FRACTIONS],
+        ids=lambda topic: topic.value,
+    )
+    def test_agent_for_different_topics(self, topic: MathTopic) -> None:
         """Test creating agents for different topics."""
-        topics = [MathTopic.ADDITION, MathTopic.MULTIPLICATION, MathTopic.FRACTIONS]
-        for topic in topics:
-            agent = create_problem_generator(
-                grade=GradeLevel.GRADE_3,
-                topic=topic,
-            )
-            assert topic.value.replace("_", " ") in agent.goal.lower()
+        agent = create_problem_generator(
+            grade=GradeLevel.GRADE_3,
+            topic=topic,
+        )
+        assert topic.value.replace("_", " ") in agent.goal.lower()
 
 
 class TestCreateProblemReviewer:
@@ -91,12 +120,12 @@ class TestCreateProblemReviewer:
         assert agent.role == "Math Problem Reviewer"
         assert "grade 1" in agent.goal.lower()
 
-    def test_reviewer_for_different_grades(self) -> None:
+    @pytest.mark.parametrize("grade", list(GradeLevel), ids=lambda grade: grade.value)
+    def test_reviewer_for_different_grades(self, grade: GradeLevel) -> None:
         """Test creating reviewers for different grades."""
-        for grade in GradeLevel:
-            agent = create_problem_reviewer(grade=grade)
-            grade_name = grade.value.replace("_", " ")
-            assert grade_name in agent.goal.lower()
+        agent = create_problem_reviewer(grade=grade)
+        grade_name = grade.value.replace("_", " ")
+        assert grade_name in agent.goal.lower()
 
 
 class TestCreateHintProvider:
@@ -111,30 +140,68 @@ class TestCreateHintProvider:
     def test_hint_provider_backstory(self) -> None:
         """Test that hint provider has appropriate backstory."""
         agent = create_hint_provider(grade=GradeLevel.GRADE_1)
-        assert "hint" in agent.backstory.lower() or "tutor" in agent.backstory.lower()
+        backstory = agent.backstory.lower()
+        assert "hint" in backstory or "tutor" in backstory
+
+
+class TestBuildAgent:
+    """Tests for build_agent function."""
+
+    def test_build_agent_by_kind(self) -> None:
+        """Test building an agent from its kind."""
+        agent = build_agent("problem_generator", GradeLevel.GRADE_4, MathTopic.WORD_PROBLEMS)
+        assert agent.role == "Mathematics Problem Generator"
+        goal = agent.goal.lower()
+        assert "word problems" in goal
+        assert "grade 4" in goal
+
+    def test_unknown_kind_raises_error(self) -> None:
+        """Test that an unknown agent kind raises ValueError."""
+        with pytest.raises(ValueError):
+            build_agent("unknown", GradeLevel.GRADE_1)
+
+    def test_missing_topic_raises_error(self) -> None:
+        """Test that topic-specific agents require a topic."""
+        with pytest.raises(ValueError):
+            build_agent("concept_expert", GradeLevel.GRADE_1)
+
+
+class TestBuildAllAgents:
+    """Tests for build_all_agents function."""
+
+    def test_builds_all_agents_with_shared_llm(self) -> None:
+        """Test that all four agents are built and share the same LLM."""
+        llm = get_llm()
+        agents = build_all_agents(GradeLevel.GRADE_2, MathTopic.SUBTRACTION, llm)
+
+        assert agents["concept_expert"].role == "Mathematics Concept Expert"
+        assert agents["problem_generator"].role == "Mathematics Problem Generator"
+        assert agents["problem_reviewer"].role == "Math Problem Reviewer"
+        assert agents["hint_provider"].role == "Mathematics Hint Provider"
+        for agent in agents.values():
+            assert agent.llm == llm
+
+
+@pytest.fixture(scope="module")
+def default_agents() -> list[Agent]:
+    """Build one agent of each kind with default settings, shared by the module."""
+    return [
+        create_math_concept_expert(GradeLevel.GRADE_1, MathTopic.ADDITION),
+        create_problem_generator(GradeLevel.GRADE_1, MathTopic.ADDITION),
+        create_problem_reviewer(GradeLevel.GRADE_1),
+        create_hint_provider(GradeLevel.GRADE_1),
+    ]
 
 
 class TestAgentProperties:
     """Tests for common agent properties."""
 
-    def test_all_agents_have_verbose_true(self) -> None:
+    def test_all_agents_have_verbose_true(self, default_agents: list[Agent]) -> None:
         """Test that all agents have verbose set to True by default."""
-        agents = [
-            create_math_concept_expert(GradeLevel.GRADE_1, MathTopic.ADDITION),
-            create_problem_generator(GradeLevel.GRADE_1, MathTopic.ADDITION),
-            create_problem_reviewer(GradeLevel.GRADE_1),
-            create_hint_provider(GradeLevel.GRADE_1),
-        ]
-        for agent in agents:
+        for agent in default_agents:
             assert agent.verbose is True
 
-    def test_all_agents_have_delegation_disabled(self) -> None:
+    def test_all_agents_have_delegation_disabled(self, default_agents: list[Agent]) -> None:
         """Test that all agents have allow_delegation set to False."""
-        agents = [
-            create_math_concept_expert(GradeLevel.GRADE_1, MathTopic.ADDITION),
-            create_problem_generator(GradeLevel.GRADE_1, MathTopic.ADDITION),
-            create_problem_reviewer(GradeLevel.GRADE_1),
-            create_hint_provider(GradeLevel.GRADE_1),
-        ]
-        for agent in agents:
+        for agent in default_agents:
             assert agent.allow_delegation is False
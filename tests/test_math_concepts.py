@@ -1,9 +1,12 @@
 """Tests for math concepts module."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from math_generator.math_concepts import (
     GRADE_TOPICS,
+    GRADE_TOPICS_SET,
     GradeLevel,
     MathConcept,
     MathProblem,
@@ -73,6 +76,11 @@ class TestMathTopic:
         assert MathTopic("addition") == MathTopic.ADDITION
         assert MathTopic("multiplication") == MathTopic.MULTIPLICATION
 
+    def test_display_name(self) -> None:
+        """Test that display names replace underscores with spaces."""
+        assert MathTopic.WORD_PROBLEMS.display_name == "word problems"
+        assert GradeLevel.GRADE_1.display_name == "grade 1"
+
 
 class TestMathConcept:
     """Tests for MathConcept model."""
@@ -89,7 +97,7 @@ class TestMathConcept:
         assert concept.grade_level == GradeLevel.GRADE_1
         assert concept.description == "Add numbers within 20"
         assert concept.difficulty == 1
-        assert concept.examples == []
+        assert concept.examples == ()
 
     def test_concept_with_examples(self) -> None:
         """Test creating concept with examples."""
@@ -99,8 +107,18 @@ class TestMathConcept:
             description="Add numbers",
             examples=["5 + 3 = 8", "7 + 2 = 9"],
         )
-        assert len(concept.examples) == 2
-        assert "5 + 3 = 8" in concept.examples
+        assert concept.examples == ("5 + 3 = 8", "7 + 2 = 9")
+
+    def test_concept_is_frozen(self) -> None:
+        """Test that concepts cannot be modified after creation."""
+        concept = MathConcept(
+            topic="addition",
+            grade_level="grade_1",
+            description="Add numbers",
+        )
+        assert concept.topic is MathTopic.ADDITION
+        with pytest.raises(FrozenInstanceError):
+            concept.difficulty = 2
 
     def test_difficulty_validation(self) -> None:
         """Test that difficulty must be between 1 and 5."""
@@ -137,7 +155,7 @@ class TestMathProblem:
         assert problem.topic == MathTopic.ADDITION
         assert problem.grade_level == GradeLevel.GRADE_1
         assert problem.difficulty == 1
-        assert problem.hints == []
+        assert problem.hints == ()
         assert problem.explanation == ""
 
     def test_problem_with_hints(self) -> None:
@@ -188,8 +206,16 @@ class TestMathProblemsSet:
             grade_level=GradeLevel.GRADE_1,
             total_problems=2,
         )
-        assert len(problems_set.problems) == 2
+        assert problems_set.problems == tuple(problems)
         assert problems_set.total_problems == 2
+        assert hash(problems_set) == hash(
+            MathProblemsSet(
+                problems=problems,
+                topic=MathTopic.ADDITION,
+                grade_level=GradeLevel.GRADE_1,
+                total_problems=2,
+            )
+        )
 
 
 class TestGetTopicsForGrade:
@@ -197,36 +223,45 @@ class TestGetTopicsForGrade:
 
     def test_kindergarten_topics(self) -> None:
         """Test kindergarten topics."""
-        topics = get_topics_for_grade(GradeLevel.KINDERGARTEN)
-        assert MathTopic.COUNTING in topics
-        assert MathTopic.ADDITION in topics
-        assert MathTopic.SUBTRACTION in topics
-        assert MathTopic.PATTERNS in topics
+        topics = frozenset(get_topics_for_grade(GradeLevel.KINDERGARTEN))
+        assert {
+            MathTopic.COUNTING,
+            MathTopic.ADDITION,
+            MathTopic.SUBTRACTION,
+            MathTopic.PATTERNS,
+        } <= topics
         # Advanced topics should not be in kindergarten
-        assert MathTopic.MULTIPLICATION not in topics
-        assert MathTopic.DIVISION not in topics
-        assert MathTopic.FRACTIONS not in topics
+        assert topics.isdisjoint(
+            {MathTopic.MULTIPLICATION, MathTopic.DIVISION, MathTopic.FRACTIONS}
+        )
 
     def test_grade_3_topics(self) -> None:
         """Test grade 3 topics."""
-        topics = get_topics_for_grade(GradeLevel.GRADE_3)
-        assert MathTopic.MULTIPLICATION in topics
-        assert MathTopic.DIVISION in topics
-        assert MathTopic.FRACTIONS in topics
-        assert MathTopic.WORD_PROBLEMS in topics
+        topics = frozenset(get_topics_for_grade(GradeLevel.GRADE_3))
+        assert {
+            MathTopic.MULTIPLICATION,
+            MathTopic.DIVISION,
+            MathTopic.FRACTIONS,
+            MathTopic.WORD_PROBLEMS,
+        } <= topics
 
     def test_grade_5_topics(self) -> None:
         """Test grade 5 topics."""
-        topics = get_topics_for_grade(GradeLevel.GRADE_5)
-        assert MathTopic.DECIMALS in topics
-        assert MathTopic.FRACTIONS in topics
-        assert MathTopic.GEOMETRY in topics
+        topics = frozenset(get_topics_for_grade(GradeLevel.GRADE_5))
+        assert {MathTopic.DECIMALS, MathTopic.FRACTIONS, MathTopic.GEOMETRY} <= topics
 
-    def test_all_grades_have_topics(self) -> None:
+    @pytest.mark.parametrize("grade", list(GradeLevel), ids=lambda grade: grade.value)
+    def test_all_grades_have_topics(self, grade: GradeLevel) -> None:
         """Test that all grades have at least some topics."""
-        for grade in GradeLevel:
-            topics = get_topics_for_grade(grade)
-            assert len(topics) > 0, f"Grade {grade.value} should have topics"
+        topics = get_topics_for_grade(grade)
+        assert len(topics) > 0, f"Grade {grade.value} should have topics"
+
+    def test_topics_are_shared_read_only(self) -> None:
+        """Test that the cached topics are the shared, immutable mapping values."""
+        topics = get_topics_for_grade(GradeLevel.GRADE_2)
+        assert isinstance(topics, tuple)
+        assert topics is GRADE_TOPICS[GradeLevel.GRADE_2]
+        assert get_topics_for_grade(GradeLevel.GRADE_2) is topics
 
 
 class TestGetConceptDescription:
@@ -291,14 +326,27 @@ class TestCreateMathConcept:
         concept_5 = create_math_concept(MathTopic.ADDITION, GradeLevel.GRADE_4)
         assert concept_k.difficulty < concept_5.difficulty
 
+    def test_concept_is_memoized(self) -> None:
+        """Test that repeated calls return the same cached concept."""
+        first = create_math_concept(MathTopic.GEOMETRY, GradeLevel.GRADE_2)
+        second = create_math_concept(MathTopic.GEOMETRY, GradeLevel.GRADE_2)
+        assert first is second
+        assert isinstance(first.examples, tuple)
+
 
 class TestGradeTopicsMapping:
     """Tests for GRADE_TOPICS mapping."""
 
-    def test_all_grades_mapped(self) -> None:
+    @pytest.mark.parametrize("grade", list(GradeLevel), ids=lambda grade: grade.value)
+    def test_all_grades_mapped(self, grade: GradeLevel) -> None:
         """Test that all grades have a mapping."""
-        for grade in GradeLevel:
-            assert grade in GRADE_TOPICS
+        assert grade in GRADE_TOPICS
+
+    def test_topic_sets_match_topic_lists(self) -> None:
+        """Test that GRADE_TOPICS_SET mirrors GRADE_TOPICS for every grade."""
+        for grade, topics in GRADE_TOPICS.items():
+            assert GRADE_TOPICS_SET[grade] == frozenset(topics)
+            assert get_topics_for_grade(grade) == tuple(topics)
 
     def test_topics_are_valid(self) -> None:
         """Test that all mapped topics are valid MathTopic values."""
@@ -1,10 +1,11 @@
 """Tests for math crew module."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from crewai import Crew
 
-from math_generator.math_concepts import GradeLevel, MathTopic
+from math_generator.math_concepts import GradeLevel, MathTopic, get_topics_for_grade
 from math_generator.math_crew import MathProblemsCrew, generate_problems_for_grade
 
 
@@ -38,20 +39,23 @@ class TestMathProblemsCrew:
             )
         assert "not appropriate" in str(exc_info.value)
 
-    def test_valid_topic_combinations(self) -> None:
-        """Test valid topic and grade combinations."""
-        valid_combinations = [
+    @pytest.mark.parametrize(
+        ("grade", "topic"),
+        [
             (GradeLevel.KINDERGARTEN, MathTopic.COUNTING),
             (GradeLevel.GRADE_1, MathTopic.ADDITION),
             (GradeLevel.GRADE_2, MathTopic.SUBTRACTION),
             (GradeLevel.GRADE_3, MathTopic.MULTIPLICATION),
             (GradeLevel.GRADE_4, MathTopic.DIVISION),
             (GradeLevel.GRADE_5, MathTopic.FRACTIONS),
-        ]
-        for grade, topic in valid_combinations:
-            crew = MathProblemsCrew(grade=grade, topic=topic)
-            assert crew.grade == grade
-            assert crew.topic == topic
+        ],
+        ids=lambda value: value.value,
+    )
+    def test_valid_topic_combinations(self, grade: GradeLevel, topic: MathTopic) -> None:
+        """Test valid topic and grade combinations."""
+        crew = MathProblemsCrew(grade=grade, topic=topic)
+        assert crew.grade == grade
+        assert crew.topic == topic
 
     def test_create_agents(self) -> None:
         """Test that _create_agents returns all expected agents."""
@@ -63,16 +67,31 @@ class TestMathProblemsCrew:
         assert "problem_reviewer" in agents
         assert "hint_provider" in agents
 
+    def test_pdf_generator_is_created_lazily(self, tmp_path) -> None:
+        """Test that the PDF generator is only built when first used."""
+        crew = MathProblemsCrew(output_dir=str(tmp_path))
+        assert "pdf_generator" not in vars(crew)
+        assert str(crew.pdf_generator.output_dir) == str(tmp_path)
+        assert crew.pdf_generator is crew.pdf_generator
+
+    def test_agents_are_built_once(self) -> None:
+        """Test that the agents dict is cached across actions."""
+        crew = MathProblemsCrew()
+        with patch.object(crew, "_create_agents", wraps=crew._create_agents) as create:
+            assert crew._agents is crew._agents
+        create.assert_called_once()
+
 
 class TestGenerateProblemsForGrade:
     """Tests for generate_problems_for_grade function."""
 
-    @patch("math_generator.math_crew.MathProblemsCrew")
-    def test_generates_for_all_topics(self, mock_crew_class: MagicMock) -> None:
+    def test_generates_for_all_topics(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that function generates problems for all grade-appropriate topics."""
-        mock_crew = MagicMock()
+        mock_crew = Mock(spec=MathProblemsCrew)
         mock_crew.generate_problems.return_value = {"result": "test"}
-        mock_crew_class.return_value = mock_crew
+        monkeypatch.setattr(
+            "math_generator.math_crew.MathProblemsCrew", MagicMock(return_value=mock_crew)
+        )
 
         result = generate_problems_for_grade(
             grade=GradeLevel.GRADE_1,
@@ -84,83 +103,96 @@ class TestGenerateProblemsForGrade:
         # Grade 1 has multiple topics, so multiple calls should be made
         assert mock_crew.generate_problems.called
 
-    def test_result_structure(self) -> None:
+    def test_result_structure(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test the structure of the returned result."""
         # Just test that the function can be called and returns expected structure
-        with patch("math_generator.math_crew.MathProblemsCrew") as mock_crew_class:
-            mock_crew = MagicMock()
-            mock_crew.generate_problems.return_value = {"result": "test"}
-            mock_crew_class.return_value = mock_crew
-
-            result = generate_problems_for_grade(GradeLevel.KINDERGARTEN)
-
-            assert isinstance(result, dict)
-            assert "grade" in result
-            assert "topics" in result
-
+        mock_crew = Mock(spec=MathProblemsCrew)
+        mock_crew.generate_problems.return_value = {"result": "test"}
+        monkeypatch.setattr(
+            "math_generator.math_crew.MathProblemsCrew", MagicMock(return_value=mock_crew)
+        )
 
-class TestCrewIntegration:
-    """Integration tests for the crew (require mocking LLM calls)."""
+        result = generate_problems_for_grade(GradeLevel.KINDERGARTEN)
 
-    @patch("math_generator.math_crew.Crew")
-    def test_generate_problems_creates_crew(self, mock_crew_class: MagicMock) -> None:
-        """Test that generate_problems creates and runs a Crew."""
-        mock_crew_instance = MagicMock()
-        mock_crew_instance.kickoff.return_value = "Generated problems"
-        mock_crew_class.return_value = mock_crew_instance
+        assert isinstance(result, dict)
+        assert "grade" in result
+        assert "topics" in result
 
-        crew = MathProblemsCrew(
-            grade=GradeLevel.GRADE_1,
-            topic=MathTopic.ADDITION,
-            verbose=False,
+    def test_topics_keep_curriculum_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that concurrently generated topics are keyed in curriculum order."""
+        mock_crew_class = MagicMock(
+            side_effect=lambda **kwargs: Mock(
+                spec=MathProblemsCrew,
+                generate_problems=Mock(return_value={"topic": kwargs["topic"].value}),
+            )
         )
-        result = crew.generate_problems(num_problems=3)
+        monkeypatch.setattr("math_generator.math_crew.MathProblemsCrew", mock_crew_class)
 
-        mock_crew_class.assert_called_once()
-        mock_crew_instance.kickoff.assert_called_once()
-        assert "result" in result
+        result = generate_problems_for_grade(GradeLevel.GRADE_3)
 
-    @patch("math_generator.math_crew.Crew")
-    def test_explain_concept_creates_crew(self, mock_crew_class: MagicMock) -> None:
-        """Test that explain_concept creates and runs a Crew."""
-        mock_crew_instance = MagicMock()
-        mock_crew_instance.kickoff.return_value = "Concept explanation"
-        mock_crew_class.return_value = mock_crew_instance
+        expected = [topic.value for topic in get_topics_for_grade(GradeLevel.GRADE_3)]
+        assert list(result["topics"]) == expected
+        assert all(result["topics"][name] == {"topic": name} for name in expected)
 
-        crew = MathProblemsCrew(
-            grade=GradeLevel.GRADE_2,
-            topic=MathTopic.SUBTRACTION,
-            verbose=False,
-        )
-        result = crew.explain_concept()
-
-        mock_crew_class.assert_called_once()
-        assert "explanation" in result
 
-    @patch("math_generator.math_crew.Crew")
-    def test_generate_worksheet_creates_crew(self, mock_crew_class: MagicMock) -> None:
-        """Test that generate_worksheet creates and runs a Crew."""
-        mock_crew_instance = MagicMock()
-        mock_crew_instance.kickoff.return_value = "Worksheet content"
-        mock_crew_class.return_value = mock_crew_instance
+class TestCrewIntegration:
+    """Integration tests for the crew (require mocking LLM calls)."""
 
-        crew = MathProblemsCrew(
-            grade=GradeLevel.GRADE_3,
-            topic=MathTopic.MULTIPLICATION,
-            verbose=False,
-        )
-        result = crew.generate_worksheet(num_problems=5)
+    @pytest.fixture
+    def mock_crew(self, monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, Mock]:
+        """Replace the CrewAI Crew class with a mock whose kickoff returns a stub.
+
+        Returns:
+            Tuple of the mocked Crew class and the crew instance it returns.
+        """
+        mock_crew_instance = Mock(spec=Crew)
+        mock_crew_instance.kickoff.return_value = "Generated content"
+        mock_crew_class = MagicMock(return_value=mock_crew_instance)
+        monkeypatch.setattr("math_generator.math_crew.Crew", mock_crew_class)
+        return mock_crew_class, mock_crew_instance
+
+    @pytest.mark.parametrize(
+        ("grade", "topic", "method", "kwargs", "result_key"),
+        [
+            (
+                GradeLevel.GRADE_1,
+                MathTopic.ADDITION,
+                "generate_problems",
+                {"num_problems": 3},
+                "result",
+            ),
+            (GradeLevel.GRADE_2, MathTopic.SUBTRACTION, "explain_concept", {}, "explanation"),
+            (
+                GradeLevel.GRADE_3,
+                MathTopic.MULTIPLICATION,
+                "generate_worksheet",
+                {"num_problems": 5},
+                "worksheet",
+            ),
+        ],
+        ids=["generate_problems", "explain_concept", "generate_worksheet"],
+    )
+    def test_action_creates_crew(
+        self,
+        mock_crew: tuple[MagicMock, Mock],
+        grade: GradeLevel,
+        topic: MathTopic,
+        method: str,
+        kwargs: dict,
+        result_key: str,
+    ) -> None:
+        """Test that each crew action creates and runs a Crew."""
+        mock_crew_class, mock_crew_instance = mock_crew
+
+        crew = MathProblemsCrew(grade=grade, topic=topic, verbose=False)
+        result = getattr(crew, method)(**kwargs)
 
         mock_crew_class.assert_called_once()
-        assert "worksheet" in result
+        mock_crew_instance.kickoff.assert_called_once()
+        assert result_key in result
 
-    @patch("math_generator.math_crew.Crew")
-    def test_generate_problems_without_hints(self, mock_crew_class: MagicMock) -> None:
+    def test_generate_problems_without_hints(self, mock_crew: tuple[MagicMock, Mock]) -> None:
         """Test generating problems without hints."""
-        mock_crew_instance = MagicMock()
-        mock_crew_instance.kickoff.return_value = "Problems"
-        mock_crew_class.return_value = mock_crew_instance
-
         crew = MathProblemsCrew()
         result = crew.generate_problems(
             num_problems=3,
@@ -170,13 +202,10 @@ class TestCrewIntegration:
 
         assert "result" in result
 
-    @patch("math_generator.math_crew.Crew")
-    def test_generate_problems_returns_metadata(self, mock_crew_class: MagicMock) -> None:
+    def test_generate_problems_returns_metadata(
+        self, mock_crew: tuple[MagicMock, Mock]
+    ) -> None:
         """Test that generate_problems returns proper metadata."""
-        mock_crew_instance = MagicMock()
-        mock_crew_instance.kickoff.return_value = "Problems"
-        mock_crew_class.return_value = mock_crew_instance
-
         crew = MathProblemsCrew(
             grade=GradeLevel.GRADE_4,
             topic=MathTopic.FRACTIONS,
@@ -1,9 +1,12 @@
 """Tests for math tasks module."""
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
+from crewai import Agent
 
+from math_generator import math_tasks
 from math_generator.math_concepts import GradeLevel, MathTopic
 from math_generator.math_tasks import (
     create_concept_explanation_task,
@@ -14,18 +17,22 @@ from math_generator.math_tasks import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def mock_task_class() -> Iterator[MagicMock]:
+    """Replace the CrewAI Task class for every test in this module."""
+    with patch.object(math_tasks, "Task") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
 def mock_agent() -> MagicMock:
-    """Create a mock agent for testing."""
-    mock = MagicMock()
-    mock.role = "Test Agent"
-    return mock
+    """Create a mock agent, shared by the module since tests only pass it through."""
+    return MagicMock(spec=Agent, role="Test Agent")
 
 
 class TestCreateConceptExplanationTask:
     """Tests for create_concept_explanation_task function."""
 
-    @patch("math_generator.math_tasks.Task")
     def test_create_task_with_basic_params(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
@@ -37,11 +44,11 @@ class TestCreateConceptExplanationTask:
         )
         mock_task_class.assert_called_once()
         call_kwargs = mock_task_class.call_args.kwargs
-        assert "addition" in call_kwargs["description"].lower()
-        assert "grade 1" in call_kwargs["description"].lower()
+        description = call_kwargs["description"].lower()
+        assert "addition" in description
+        assert "grade 1" in description
         assert call_kwargs["agent"] == mock_agent
 
-    @patch("math_generator.math_tasks.Task")
     def test_task_expected_output(self, mock_task_class: MagicMock, mock_agent: MagicMock) -> None:
         """Test that task has appropriate expected output."""
         create_concept_explanation_task(
@@ -50,30 +57,32 @@ class TestCreateConceptExplanationTask:
             grade=GradeLevel.GRADE_3,
         )
         call_kwargs = mock_task_class.call_args.kwargs
-        assert "multiplication" in call_kwargs["expected_output"].lower()
-        assert "grade 3" in call_kwargs["expected_output"].lower()
-
-    @patch("math_generator.math_tasks.Task")
+        expected_output = call_kwargs["expected_output"].lower()
+        assert "multiplication" in expected_output
+        assert "grade 3" in expected_output
+
+    @pytest.mark.parametrize(
+        "topic",
+        [MathTopic.FRACTIONS, MathTopic.GEOMETRY, MathTopic.TIME],
+        ids=lambda topic: topic.value,
+    )
     def test_task_for_different_topics(
-        self, mock_task_class: MagicMock, mock_agent: MagicMock
+        self, mock_task_class: MagicMock, mock_agent: MagicMock, topic: MathTopic
     ) -> None:
         """Test creating tasks for different topics."""
-        for topic in [MathTopic.FRACTIONS, MathTopic.GEOMETRY, MathTopic.TIME]:
-            mock_task_class.reset_mock()
-            create_concept_explanation_task(
-                agent=mock_agent,
-                topic=topic,
-                grade=GradeLevel.GRADE_3,
-            )
-            call_kwargs = mock_task_class.call_args.kwargs
-            topic_name = topic.value.replace("_", " ")
-            assert topic_name in call_kwargs["description"].lower()
+        create_concept_explanation_task(
+            agent=mock_agent,
+            topic=topic,
+            grade=GradeLevel.GRADE_3,
+        )
+        call_kwargs = mock_task_class.call_args.kwargs
+        topic_name = topic.value.replace("_", " ")
+        assert topic_name in call_kwargs["description"].lower()
 
 
 class TestCreateProblemGenerationTask:
     """Tests for create_problem_generation_task function."""
 
-    @patch("math_generator.math_tasks.Task")
     def test_create_task_with_defaults(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
@@ -87,7 +96,6 @@ class TestCreateProblemGenerationTask:
         assert call_kwargs["agent"] == mock_agent
         assert "5" in call_kwargs["description"]  # Default num_problems
 
-    @patch("math_generator.math_tasks.Task")
     def test_create_task_with_custom_params(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
@@ -103,7 +111,6 @@ class TestCreateProblemGenerationTask:
         assert "10" in call_kwargs["description"]
         assert "subtraction" in call_kwargs["description"].lower()
 
-    @patch("math_generator.math_tasks.Task")
     def test_task_includes_formatting_guidelines(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
@@ -114,15 +121,15 @@ class TestCreateProblemGenerationTask:
             grade=GradeLevel.GRADE_1,
         )
         call_kwargs = mock_task_class.call_args.kwargs
-        assert "question" in call_kwargs["description"].lower()
-        assert "answer" in call_kwargs["description"].lower()
-        assert "explanation" in call_kwargs["description"].lower()
+        description = call_kwargs["description"].lower()
+        assert "question" in description
+        assert "answer" in description
+        assert "explanation" in description
 
 
 class TestCreateProblemReviewTask:
     """Tests for create_problem_review_task function."""
 
-    @patch("math_generator.math_tasks.Task")
     def test_create_review_task(self, mock_task_class: MagicMock, mock_agent: MagicMock) -> None:
         """Test creating problem review task."""
         create_problem_review_task(
@@ -131,16 +138,16 @@ class TestCreateProblemReviewTask:
             grade=GradeLevel.GRADE_1,
         )
         call_kwargs = mock_task_class.call_args.kwargs
+        description = call_kwargs["description"].lower()
         assert call_kwargs["agent"] == mock_agent
-        assert "review" in call_kwargs["description"].lower()
-        assert "accuracy" in call_kwargs["description"].lower()
+        assert "review" in description
+        assert "accuracy" in description
 
-    @patch("math_generator.math_tasks.Task")
     def test_review_task_with_context(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
         """Test creating review task with context."""
-        context_task = MagicMock()
+        context_task = object()
         create_problem_review_task(
             agent=mock_agent,
             topic=MathTopic.ADDITION,
@@ -154,7 +161,6 @@ class TestCreateProblemReviewTask:
 class TestCreateHintGenerationTask:
     """Tests for create_hint_generation_task function."""
 
-    @patch("math_generator.math_tasks.Task")
     def test_create_hint_task(self, mock_task_class: MagicMock, mock_agent: MagicMock) -> None:
         """Test creating hint generation task."""
         create_hint_generation_task(
@@ -163,11 +169,11 @@ class TestCreateHintGenerationTask:
             grade=GradeLevel.GRADE_3,
         )
         call_kwargs = mock_task_class.call_args.kwargs
+        description = call_kwargs["description"].lower()
         assert call_kwargs["agent"] == mock_agent
-        assert "hint" in call_kwargs["description"].lower()
-        assert "multiplication" in call_kwargs["description"].lower()
+        assert "hint" in description
+        assert "multiplication" in description
 
-    @patch("math_generator.math_tasks.Task")
     def test_hint_task_mentions_progressive_hints(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
@@ -178,14 +184,14 @@ class TestCreateHintGenerationTask:
             grade=GradeLevel.GRADE_1,
         )
         call_kwargs = mock_task_class.call_args.kwargs
-        assert "hint 1" in call_kwargs["description"].lower()
-        assert "hint 2" in call_kwargs["description"].lower()
+        description = call_kwargs["description"].lower()
+        assert "hint 1" in description
+        assert "hint 2" in description
 
 
 class TestCreateWorksheetCompilationTask:
     """Tests for create_worksheet_compilation_task function."""
 
-    @patch("math_generator.math_tasks.Task")
     def test_create_worksheet_task(self, mock_task_class: MagicMock, mock_agent: MagicMock) -> None:
         """Test creating worksheet compilation task."""
         create_worksheet_compilation_task(
@@ -194,11 +200,11 @@ class TestCreateWorksheetCompilationTask:
             grade=GradeLevel.GRADE_2,
         )
         call_kwargs = mock_task_class.call_args.kwargs
+        description = call_kwargs["description"].lower()
         assert call_kwargs["agent"] == mock_agent
-        assert "worksheet" in call_kwargs["description"].lower()
-        assert "subtraction" in call_kwargs["description"].lower()
+        assert "worksheet" in description
+        assert "subtraction" in description
 
-    @patch("math_generator.math_tasks.Task")
     def test_worksheet_task_includes_sections(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
@@ -209,15 +215,15 @@ class TestCreateWorksheetCompilationTask:
             grade=GradeLevel.GRADE_1,
         )
         call_kwargs = mock_task_class.call_args.kwargs
-        assert "title" in call_kwargs["description"].lower()
-        assert "answer key" in call_kwargs["description"].lower()
+        description = call_kwargs["description"].lower()
+        assert "title" in description
+        assert "answer key" in description
 
-    @patch("math_generator.math_tasks.Task")
     def test_worksheet_task_with_context(
         self, mock_task_class: MagicMock, mock_agent: MagicMock
     ) -> None:
         """Test creating worksheet task with multiple context tasks."""
-        context_tasks = [MagicMock(), MagicMock(), MagicMock()]
+        context_tasks = [object(), object(), object()]
         create_worksheet_compilation_task(
             agent=mock_agent,
             topic=MathTopic.ADDITION,
@@ -1,41 +1,22 @@
 """Tests for PDF generator module."""
 
+import io
 import os
+import shutil
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from math_generator.pdf_generator import MathPDFGenerator
+from math_generator.pdf_generator import MathPDFGenerator, _classify_lines
 
-
-class TestMathPDFGenerator:
-    """Tests for MathPDFGenerator class."""
-
-    @pytest.fixture
-    def pdf_generator(self, tmp_path: Path) -> MathPDFGenerator:
-        """Create a PDF generator with temporary output directory.
-
-        Args:
-            tmp_path: Pytest temporary path fixture.
-
-        Returns:
-            MathPDFGenerator instance.
-        """
-        return MathPDFGenerator(output_dir=str(tmp_path))
-
-    @pytest.fixture
-    def sample_problems_data(self) -> dict:
-        """Create sample problem data for testing.
-
-        Returns:
-            Sample problem data dictionary.
-        """
-        return {
-            "grade": "grade_1",
-            "topic": "addition",
-            "num_problems": 3,
-            "difficulty": 1,
-            "result": """Problem 1:
+# Read-only sample crew results shared by the PDF generator tests
+_SAMPLE_PROBLEMS_DATA = {
+    "grade": "grade_1",
+    "topic": "addition",
+    "num_problems": 3,
+    "difficulty": 1,
+    "result": """Problem 1:
 Question: If you have 2 apples and get 3 more apples, how many apples do you have?
 Answer: 5
 Explanation: Start with 2, add 3 more: 2 + 3 = 5
@@ -49,45 +30,31 @@ Problem 3:
 Question: There are 5 birds on a tree. 1 more bird lands on the tree. How many birds are there now?
 Answer: 6
 Explanation: 5 + 1 = 6 birds""",
-            "tasks_output": [
-                "Generated 3 problems",
-                "Hint 1: Count the starting number first...",
-            ],
-        }
-
-    @pytest.fixture
-    def sample_concept_data(self) -> dict:
-        """Create sample concept data for testing.
-
-        Returns:
-            Sample concept data dictionary.
-        """
-        return {
-            "grade": "grade_1",
-            "topic": "addition",
-            "description": "Basic addition with single digits",
-            "explanation": """Addition is when we put numbers together to make a bigger number.
+    "tasks_output": [
+        "Generated 3 problems",
+        "Hint 1: Count the starting number first...",
+    ],
+}
+
+_SAMPLE_CONCEPT_DATA = {
+    "grade": "grade_1",
+    "topic": "addition",
+    "description": "Basic addition with single digits",
+    "explanation": """Addition is when we put numbers together to make a bigger number.
 
 When we add, we are combining groups of things. For example, if you have 2 cookies and get 1 more cookie, you now have 3 cookies total.
 
 We use the plus sign (+) to show addition. The equal sign (=) shows what the answer is.
 
 Example: 2 + 1 = 3""",
-        }
-
-    @pytest.fixture
-    def sample_worksheet_data(self) -> dict:
-        """Create sample worksheet data for testing.
-
-        Returns:
-            Sample worksheet data dictionary.
-        """
-        return {
-            "grade": "grade_2",
-            "topic": "subtraction",
-            "num_problems": 5,
-            "difficulty": 2,
-            "worksheet": """Introduction
+}
+
+_SAMPLE_WORKSHEET_DATA = {
+    "grade": "grade_2",
+    "topic": "subtraction",
+    "num_problems": 5,
+    "difficulty": 2,
+    "worksheet": """Introduction
 Welcome to your subtraction worksheet!
 
 Review
@@ -100,73 +67,97 @@ Problems
 Answer Key
 1. 7
 2. 3""",
-        }
+}
 
-    def test_pdf_generator_initialization(self, tmp_path: Path) -> None:
-        """Test PDF generator initialization."""
-        generator = MathPDFGenerator(output_dir=str(tmp_path))
-        assert generator.output_dir == tmp_path
-        assert tmp_path.exists()
 
-    def test_generate_problems_pdf(
-        self, pdf_generator: MathPDFGenerator, sample_problems_data: dict
-    ) -> None:
-        """Test generating a problems PDF."""
-        pdf_path = pdf_generator.generate_problems_pdf(
-            data=sample_problems_data, frequency="daily"
-        )
-
-        assert os.path.exists(pdf_path)
-        assert pdf_path.endswith(".pdf")
-        assert "grade_1" in pdf_path
-        assert "addition" in pdf_path
-        assert "problems" in pdf_path
-        assert "daily" in pdf_path
-
-    def test_generate_problems_pdf_without_hints(
-        self, pdf_generator: MathPDFGenerator, sample_problems_data: dict
-    ) -> None:
-        """Test generating problems PDF without hints."""
-        pdf_path = pdf_generator.generate_problems_pdf(
-            data=sample_problems_data, frequency="daily", include_hints=False
-        )
-
-        assert os.path.exists(pdf_path)
+class TestMathPDFGenerator:
+    """Tests for MathPDFGenerator class."""
 
-    def test_generate_problems_pdf_without_answers(
-        self, pdf_generator: MathPDFGenerator, sample_problems_data: dict
-    ) -> None:
-        """Test generating problems PDF without answers."""
-        pdf_path = pdf_generator.generate_problems_pdf(
-            data=sample_problems_data, frequency="daily", include_answers=False
-        )
+    @pytest.fixture(scope="class")
+    def pdf_generator(self, tmp_path_factory: pytest.TempPathFactory) -> MathPDFGenerator:
+        """Create a PDF generator with a temporary output directory, shared by the class.
 
-        assert os.path.exists(pdf_path)
+        Args:
+            tmp_path_factory: Pytest temporary path factory fixture.
 
-    def test_generate_concept_pdf(
-        self, pdf_generator: MathPDFGenerator, sample_concept_data: dict
-    ) -> None:
-        """Test generating a concept explanation PDF."""
-        pdf_path = pdf_generator.generate_concept_pdf(
-            data=sample_concept_data, frequency="weekly"
-        )
+        Returns:
+            MathPDFGenerator instance.
+        """
+        return MathPDFGenerator(output_dir=tmp_path_factory.mktemp("pdfs"))
 
-        assert os.path.exists(pdf_path)
-        assert "concepts" in pdf_path
-        assert "weekly" in pdf_path
+    def test_pdf_generator_initialization(self, tmp_path: Path) -> None:
+        """Test PDF generator initialization."""
+        generator = MathPDFGenerator(output_dir=tmp_path)
+        assert generator.output_dir == tmp_path
+        assert tmp_path.exists()
 
-    def test_generate_worksheet_pdf(
-        self, pdf_generator: MathPDFGenerator, sample_worksheet_data: dict
+    def test_stylesheet_is_shared(self, tmp_path: Path) -> None:
+        """Test that generators share one prebuilt stylesheet with the custom styles."""
+        first = MathPDFGenerator(output_dir=tmp_path / "a")
+        second = MathPDFGenerator(output_dir=tmp_path / "b")
+        assert first.styles is second.styles
+        for name in ("CustomTitle", "SectionHeading", "Problem", "Answer", "Hint", "Concept"):
+            assert name in first.styles
+
+    @pytest.mark.parametrize(
+        ("method_name", "data", "options", "expected_parts"),
+        [
+            (
+                "generate_problems_pdf",
+                _SAMPLE_PROBLEMS_DATA,
+                {"frequency": "daily"},
+                ["grade_1", "addition", "problems", "daily"],
+            ),
+            (
+                "generate_problems_pdf",
+                _SAMPLE_PROBLEMS_DATA,
+                {"frequency": "daily", "include_hints": False},
+                [],
+            ),
+            (
+                "generate_problems_pdf",
+                _SAMPLE_PROBLEMS_DATA,
+                {"frequency": "daily", "include_answers": False},
+                [],
+            ),
+            ("generate_problems_pdf", _SAMPLE_PROBLEMS_DATA, {"frequency": "weekly"}, ["weekly"]),
+            (
+                "generate_concept_pdf",
+                _SAMPLE_CONCEPT_DATA,
+                {"frequency": "weekly"},
+                ["concepts", "weekly"],
+            ),
+            (
+                "generate_worksheet_pdf",
+                _SAMPLE_WORKSHEET_DATA,
+                {"frequency": "weekly"},
+                ["worksheet", "grade_2", "subtraction"],
+            ),
+        ],
+        ids=[
+            "problems",
+            "problems_without_hints",
+            "problems_without_answers",
+            "problems_weekly",
+            "concept",
+            "worksheet",
+        ],
+    )
+    def test_generate_pdf(
+        self,
+        pdf_generator: MathPDFGenerator,
+        method_name: str,
+        data: dict,
+        options: dict,
+        expected_parts: list[str],
     ) -> None:
-        """Test generating a worksheet PDF."""
-        pdf_path = pdf_generator.generate_worksheet_pdf(
-            data=sample_worksheet_data, frequency="weekly"
-        )
+        """Test generating each kind of PDF."""
+        pdf_path = getattr(pdf_generator, method_name)(data=data, **options)
 
-        assert os.path.exists(pdf_path)
-        assert "worksheet" in pdf_path
-        assert "grade_2" in pdf_path
-        assert "subtraction" in pdf_path
+        assert Path(pdf_path).is_file()
+        assert pdf_path.endswith(".pdf")
+        for part in expected_parts:
+            assert part in pdf_path
 
     def test_filename_generation(self, pdf_generator: MathPDFGenerator) -> None:
         """Test filename generation with various parameters."""
@@ -174,10 +165,7 @@ Answer Key
             grade="grade_1", topic="addition", doc_type="problems", frequency="daily"
         )
 
-        assert "grade_1" in filename
-        assert "addition" in filename
-        assert "problems" in filename
-        assert "daily" in filename
+        assert filename.startswith("grade_1_addition_problems_daily_")
         assert filename.endswith(".pdf")
 
     def test_filename_with_special_characters(
@@ -191,25 +179,88 @@ Answer Key
             frequency="weekly",
         )
 
-        assert "word_problems" in filename
-        assert "/" not in filename
+        assert filename.startswith("grade_3_word_problems_worksheet_weekly_")
+        assert not {"/", " "} & set(filename)
+
+    def test_filename_uses_given_timestamp(self, pdf_generator: MathPDFGenerator) -> None:
+        """Test that the filename date comes from the supplied timestamp."""
+        filename = pdf_generator._get_filename(
+            grade="grade_2",
+            topic="money",
+            doc_type="concepts",
+            frequency="weekly",
+            now=datetime(2025, 1, 2),
+        )
+        assert filename == "grade_2_money_concepts_weekly_20250102.pdf"
         assert " " not in filename
 
-    def test_weekly_frequency(
-        self, pdf_generator: MathPDFGenerator, sample_problems_data: dict
-    ) -> None:
-        """Test PDF generation with weekly frequency."""
-        pdf_path = pdf_generator.generate_problems_pdf(
-            data=sample_problems_data, frequency="weekly"
+    def test_generate_pdf_to_stream(self) -> None:
+        """Test writing a PDF to a stream without an output directory."""
+        generator = MathPDFGenerator(output_dir=None)
+        stream = io.BytesIO()
+
+        filename = generator.generate_problems_pdf(data=_SAMPLE_PROBLEMS_DATA, stream=stream)
+
+        assert filename.endswith(".pdf")
+        assert os.sep not in filename
+        assert stream.getvalue().startswith(b"%PDF")
+        with pytest.raises(ValueError):
+            generator.generate_problems_pdf(data=_SAMPLE_PROBLEMS_DATA)
+
+    def test_worksheet_merges_plain_sections(self, pdf_generator: MathPDFGenerator) -> None:
+        """Test that consecutive plain worksheet sections become one paragraph."""
+        story: list = []
+        pdf_generator._add_worksheet_content(
+            story, "**Intro:**\nWelcome!\n\n1. 2 + 3 = ?\n\nLet's Practice:\n\n2. 4 + 4 = ?"
         )
 
-        assert "weekly" in pdf_path
-        assert os.path.exists(pdf_path)
+        texts = [flowable.text for flowable in story if hasattr(flowable, "text")]
+        assert texts == [
+            "Intro:",
+            "Welcome!<br/><br/>1. 2 + 3 = ?",
+            "Let's Practice:",
+            "2. 4 + 4 = ?",
+        ]
 
     def test_custom_output_directory(self, tmp_path: Path) -> None:
         """Test PDF generator with custom output directory."""
         custom_dir = tmp_path / "custom_output"
-        generator = MathPDFGenerator(output_dir=str(custom_dir))
+        generator = MathPDFGenerator(output_dir=custom_dir)
 
         assert custom_dir.exists()
         assert generator.output_dir == custom_dir
+
+    def test_output_directory_recreated(self, tmp_path: Path) -> None:
+        """Test that a new generator recreates an output directory removed since the last one."""
+        output_dir = tmp_path / "recreated"
+        MathPDFGenerator(output_dir=output_dir)
+        shutil.rmtree(output_dir)
+
+        generator = MathPDFGenerator(output_dir=output_dir)
+        pdf_path = generator.generate_concept_pdf(data=_SAMPLE_CONCEPT_DATA)
+
+        assert Path(pdf_path).is_file()
+
+
+class TestClassifyLines:
+    """Tests for _classify_lines helper."""
+
+    def test_tags_known_prefixes(self) -> None:
+        """Test that lines are stripped, blank lines dropped, and prefixes tagged."""
+        text = "Problem 1:\n  Question: 2 + 2?\n\nAnswer: 4\nExplanation: Add.\nHint 1: Count\nMore"
+        assert [tag for tag, _ in _classify_lines(text)] == [
+            "problem",
+            "question",
+            "answer",
+            "explanation",
+            "hint",
+            "other",
+        ]
+        assert _classify_lines(text)[1] == ("question", "Question: 2 + 2?")
+
+    def test_prefix_must_start_the_line(self) -> None:
+        """Test that prefixes only count at the start of a line."""
+        assert _classify_lines("The Answer: 4\nProblem2") == [
+            ("other", "The Answer: 4"),
+            ("other", "Problem2"),
+        ]